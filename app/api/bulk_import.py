@@ -0,0 +1,181 @@
+from collections.abc import AsyncIterator
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.cache import response_cache
+from app.db.session import engine
+from app.models.article import (
+    Article,
+    ArticleImport,
+    ArticleImportReport,
+    ArticleImportResult,
+    make_excerpt,
+)
+from app.models.author import Author
+from app.models.category import Category
+from app.models.link import ArticleTagLink
+from app.models.tag import Tag
+from app.services.latest_feed import latest_feed
+
+
+async def ndjson_lines(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, bytes]]:
+    """Splits a streamed body into numbered lines, skipping blank ones."""
+    buffer = b""
+    number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            if line.strip():
+                yield number, line
+    if buffer.strip():
+        yield number + 1, buffer
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, e['loc'])) or 'line'}: {e['msg']}" for e in error.errors()
+    )
+
+
+class ArticleImporter:
+    """Inserts streamed articles in chunked transactions.
+
+    Author and category IDs are checked with one query per chunk, tags are
+    resolved by name (creating missing ones) and articles and tag links are
+    written with executemany inserts. IDs and tag names already seen are
+    remembered across chunks.
+    """
+
+    def __init__(self, session: AsyncSession, chunk_size: int):
+        self.session = session
+        self.chunk_size = chunk_size
+        self.report = ArticleImportReport()
+        self._pending: list[tuple[int, ArticleImport]] = []
+        self._authors: set[int] = set()
+        self._categories: set[int] = set()
+        self._tags: dict[str, int] = {}
+
+    async def add(self, line: int, raw: bytes) -> None:
+        try:
+            item = ArticleImport.model_validate_json(raw)
+        except ValidationError as e:
+            self._fail(line, _validation_message(e))
+            return
+        self._pending.append((line, item))
+        if len(self._pending) >= self.chunk_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        await self._load_missing(Author, {item.author_id for _, item in pending})
+        await self._load_missing(Category, {item.category_id for _, item in pending})
+        valid = []
+        for line, item in pending:
+            if item.author_id not in self._authors:
+                self._fail(line, "Author not found")
+            elif item.category_id not in self._categories:
+                self._fail(line, "Category not found")
+            else:
+                valid.append((line, item))
+        if not valid:
+            return
+        try:
+            created_tags = await self._resolve_tags(valid)
+            ids = await _insert_returning_ids(
+                self.session,
+                Article,
+                [
+                    {
+                        **item.model_dump(exclude={"tags"}),
+                        "excerpt": make_excerpt(item.content),
+                    }
+                    for _, item in valid
+                ],
+            )
+            results, links = [], []
+            for (line, item), article_id in zip(valid, ids):
+                results.append(ArticleImportResult(line=line, id=article_id))
+                links += [
+                    {"article_id": article_id, "tag_id": tag_id}
+                    for tag_id in {self._tags[name] for name in _tag_names(item)}
+                ]
+            if links:
+                await self.session.execute(insert(ArticleTagLink), links)
+            await self.session.commit()
+        except DBAPIError as e:
+            await self.session.rollback()
+            # Names cached from this chunk may have been rolled back with it.
+            self._tags.clear()
+            for line, _ in valid:
+                self._fail(line, f"Chunk rolled back: {e.orig}")
+            return
+        self.report.results += results
+        self.report.created += len(valid)
+        stale = {"articles"} | {f"author:{item.author_id}" for _, item in valid}
+        stale |= {
+            f"tag:{self._tags[name]}" for _, item in valid for name in _tag_names(item)
+        }
+        if created_tags:
+            stale.add("tags")
+        response_cache.invalidate(*stale)
+        latest_feed.reset()
+
+    async def finish(self) -> ArticleImportReport:
+        await self.flush()
+        self.report.results.sort(key=lambda result: result.line)
+        return self.report
+
+    async def _load_missing(self, model, ids: set[int]) -> None:
+        known = self._authors if model is Author else self._categories
+        missing = ids - known
+        if missing:
+            found = await self.session.exec(
+                select(model.id).where(model.id.in_(missing))
+            )
+            known.update(found.all())
+
+    async def _resolve_tags(self, valid) -> bool:
+        """Fills the name to ID map for this chunk; returns whether tags were created."""
+        names = {
+            name for _, item in valid for name in _tag_names(item)
+        } - self._tags.keys()
+        if not names:
+            return False
+        found = await self.session.exec(
+            select(Tag.name, Tag.id).where(Tag.name.in_(names))
+        )
+        self._tags.update(found.all())
+        missing = sorted(names - self._tags.keys())
+        if missing:
+            rows = [{"name": name} for name in missing]
+            ids = await _insert_returning_ids(self.session, Tag, rows)
+            self._tags.update(zip(missing, ids))
+        return bool(missing)
+
+    def _fail(self, line: int, error: str) -> None:
+        self.report.failed += 1
+        self.report.results.append(ArticleImportResult(line=line, error=error))
+
+
+async def _insert_returning_ids(session: AsyncSession, model, rows: list[dict]):
+    """Inserts rows with executemany and returns their IDs in parameter order."""
+    if engine.dialect.name == "sqlite":
+        # SQLite has no insert sentinel, so ordered RETURNING would cost one
+        # statement per row. It assigns rowids in statement order under its
+        # write lock, so sorting the returned IDs restores that order.
+        result = await session.execute(insert(model).returning(model.id), rows)
+        return sorted(result.scalars())
+    statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return (await session.execute(statement, rows)).scalars().all()
+
+
+def _tag_names(item: ArticleImport) -> set[str]:
+    return {name.strip() for name in item.tags if name.strip()}
@@ -0,0 +1,227 @@
+import hashlib
+import json
+import time
+from typing import Any, Callable
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from app.api.deps import reads_from_replica
+from app.core.cache import CacheEntry, response_cache
+from app.core.coalescing import request_coalescer
+from app.core.compression import (
+    compressible,
+    compress_body,
+    compression_level,
+    negotiate,
+)
+from app.core.config import settings
+
+Tagger = Callable[[Request, Any], set[str]]
+
+
+def cache_key(request: Request) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def cached_route(tagger: Tagger) -> type[APIRoute]:
+    """Builds a route class that serves GET responses from `response_cache`.
+
+    `tagger` receives the request and the decoded JSON payload of a fresh
+    response and returns the invalidation tags the entry is stored under.
+    Concurrent misses for the same key are coalesced by `request_coalescer`.
+    """
+
+    class CachedRoute(APIRoute):
+        def get_route_handler(self) -> Callable:
+            handler = super().get_route_handler()
+            if "GET" not in self.methods:
+                return handler
+            response_class = getattr(self.response_class, "value", self.response_class)
+            coalesce = not issubclass(response_class, StreamingResponse)
+
+            async def fresh_response(
+                request: Request, key: str, encoding: str | None, generation: int
+            ) -> tuple[Response, CacheEntry | None]:
+                """Runs the endpoint; returns its response and the entry to share."""
+                response = await handler(request)
+                if isinstance(response, StreamingResponse):
+                    return response, None
+                headers = {
+                    k: v
+                    for k, v in response.headers.items()
+                    if k.lower() not in ("content-length", "content-type")
+                }
+                entry = CacheEntry(
+                    body=response.body,
+                    status_code=response.status_code,
+                    headers=headers,
+                    media_type=response.media_type,
+                )
+                if not response_cache.enabled:
+                    return response, entry
+                if response.status_code == 200 and not _may_lag(request):
+                    entry.tags = frozenset(tagger(request, json.loads(response.body)))
+                    response_cache.set(key, entry, generation)
+                    response = await _entry_response(
+                        key, entry, encoding, "MISS", generation
+                    )
+                    return response, entry
+                response.headers["X-Cache"] = "MISS"
+                return response, entry
+
+            async def cached_handler(request: Request) -> Response:
+                key = cache_key(request)
+                encoding = negotiate(request.headers.get("accept-encoding", ""))
+                generation = response_cache.generation
+                entry = response_cache.get(key)
+                if entry is not None:
+                    return await _entry_response(
+                        key, entry, encoding, "HIT", generation
+                    )
+                if not (coalesce and settings.COALESCE_REQUESTS):
+                    response, _ = await fresh_response(
+                        request, key, encoding, generation
+                    )
+                    return response
+                # A flight started before a write is not joined after it.
+                flight_key = (key, _auth_scope(request), generation)
+                (response, entry), shared = await request_coalescer.run(
+                    flight_key,
+                    lambda: fresh_response(request, key, encoding, generation),
+                )
+                if not shared:
+                    return response
+                if entry is None:
+                    response, _ = await fresh_response(
+                        request, key, encoding, generation
+                    )
+                    return response
+                # Served from the cache when the leader stored it, so each
+                # encoding is still compressed once. Not counted: this
+                # request already counted its miss.
+                cached = response_cache.peek(key)
+                if cached is not None:
+                    return await _entry_response(
+                        key, cached, encoding, "COALESCED", generation
+                    )
+                return Response(
+                    content=entry.body,
+                    status_code=entry.status_code,
+                    headers={**entry.headers, "X-Cache": "COALESCED"},
+                    media_type=entry.media_type,
+                )
+
+            return cached_handler
+
+    return CachedRoute
+
+
+async def _entry_response(
+    key: str, entry: CacheEntry, encoding: str | None, status: str, generation: int
+) -> Response:
+    """Builds the response for a cache entry, compressed once per encoding.
+
+    The first request for an encoding compresses the body and stores the
+    result beside the entry; later ones send the stored bytes as they are.
+    """
+    headers = {**entry.headers, "X-Cache": status}
+    body = entry.body
+    if len(body) >= settings.COMPRESSION_MIN_SIZE and compressible(entry.media_type):
+        vary = headers.pop("vary", None)
+        headers["Vary"] = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+        if encoding is not None:
+            body = entry.encoded.get(encoding)
+            if body is None:
+                body = await compress_body(
+                    entry.body, encoding, compression_level(encoding, cached=True)
+                )
+                response_cache.add_encoding(key, entry, encoding, body, generation)
+            headers["Content-Encoding"] = encoding
+    return Response(
+        content=body,
+        status_code=entry.status_code,
+        headers=headers,
+        media_type=entry.media_type,
+    )
+
+
+def _auth_scope(request: Request) -> tuple[str, bool]:
+    """What besides the URL may change a response: credentials and the database.
+
+    Requests pinned to the primary after a write must not share a response
+    read from a replica.
+    """
+    authorization = request.headers.get("authorization", "")
+    digest = hashlib.sha256(authorization.encode()).hexdigest() if authorization else ""
+    return digest, reads_from_replica(request)
+
+
+def _may_lag(request: Request) -> bool:
+    """Whether the response was read from a replica that may predate the last write.
+
+    Caching it would keep serving the replica's stale rows after the
+    invalidation that was meant to drop them.
+    """
+    return (
+        getattr(request.state, "db_replica", False)
+        and time.monotonic() - response_cache.invalidated_at
+        < settings.DB_READ_YOUR_WRITES_SECONDS
+    )
+
+
+def _article_tags(article: dict) -> set[str]:
+    # List items carry only the fields picked with `fields=`; a response
+    # without, say, the author cannot go stale when the author changes.
+    tags = {f"article:{article['id']}"}
+    for related in ("author", "category"):
+        if article.get(f"{related}_id") is not None:
+            tags.add(f"{related}:{article[f'{related}_id']}")
+        elif article.get(related):
+            tags.add(f"{related}:{article[related]['id']}")
+    for tag in article.get("tags") or []:
+        tags.add(f"tag:{tag['id']}")
+    return tags
+
+
+def article_tagger(request: Request, payload: Any) -> set[str]:
+    if request.url.path.endswith("/facets"):
+        tags = {f"category:{c['id']}" for c in payload["categories"]}
+        tags |= {f"tag:{t['id']}" for t in payload["tags"]}
+        return tags | _filter_tags(request)
+    if isinstance(payload, dict):
+        return _article_tags(payload)
+    tags = set()
+    for article in payload:
+        tags |= _article_tags(article)
+    return tags | _filter_tags(request)
+
+
+def _filter_tags(request: Request) -> set[str]:
+    """Tags of a response that depends on which articles match the filters."""
+    tags = {"articles"}
+    params = request.query_params
+    if params.get("category"):
+        tags.add(f"category-name:{params['category']}")
+    if params.get("tags"):
+        tags |= {f"tag-name:{name.strip()}" for name in params["tags"].split(",")}
+    if params.get("search"):
+        tags.add("articles:search")
+    return tags
+
+
+def _collection_tagger(collection: str, prefix: str) -> Tagger:
+    def tagger(request: Request, payload: Any) -> set[str]:
+        if isinstance(payload, list):
+            return {collection} | {f"{prefix}:{item['id']}" for item in payload}
+        tags = {f"{prefix}:{payload['id']}"}
+        for article in payload.get("articles", []):
+            tags.add(f"article:{article['id']}")
+        return tags
+
+    return tagger
+
+
+author_tagger = _collection_tagger("authors", "author")
+category_tagger = _collection_tagger("categories", "category")
+tag_tagger = _collection_tagger("tags", "tag")
@@ -1,7 +1,85 @@
-from typing import Generator
-from sqlmodel import Session
-from app.db.session import get_session as get_db_session
+import time
+from typing import AsyncGenerator
+from fastapi import Depends, HTTPException, Request, Response
+from fastapi.security import OAuth2PasswordBearer
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.auth import CurrentUser, auth_cache
+from app.core.config import settings
+from app.db.session import replica_engines, session_scope
 
+oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl=f"{settings.API_V1_STR}/login/access-token"
+)
+# Holds the time until which a client that wrote reads from the primary.
+PRIMARY_UNTIL_COOKIE = "db_primary_until"
 
-def get_session() -> Generator:
-    yield from get_db_session()
\ No newline at end of file
+
+async def get_session(
+    request: Request, response: Response
+) -> AsyncGenerator[AsyncSession, None]:
+    """Opens a session on the primary.
+
+    Write requests also pin the client to the primary for
+    DB_READ_YOUR_WRITES_SECONDS, so its next reads see the write even if
+    the replicas lag behind.
+    """
+    if replica_engines and request.method not in ("GET", "HEAD", "OPTIONS"):
+        window = settings.DB_READ_YOUR_WRITES_SECONDS
+        response.set_cookie(
+            PRIMARY_UNTIL_COOKIE,
+            str(time.time() + window),
+            max_age=max(1, round(window)),
+            httponly=True,
+            samesite="lax",
+        )
+    async with session_scope() as session:
+        yield session
+
+
+def reads_from_replica(request: Request) -> bool:
+    if not replica_engines:
+        return False
+    try:
+        primary_until = float(request.cookies.get(PRIMARY_UNTIL_COOKIE, 0))
+    except ValueError:
+        primary_until = 0
+    return primary_until < time.time()
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Opens a session on a read replica, or on the primary without replicas."""
+    read_only = reads_from_replica(request)
+    request.state.db_replica = read_only
+    async with session_scope(read_only=read_only) as session:
+        yield session
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_session),
+) -> CurrentUser:
+    """Resolves the bearer token to its user and the permissions of their roles."""
+    user_uuid = auth_cache.decode(token)
+    user = await auth_cache.user(session, user_uuid) if user_uuid else None
+    if user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return user
+
+
+def require_permission(permission: str):
+    """Builds a dependency that admits admins and users granted `permission`."""
+
+    async def check_permission(
+        user: CurrentUser = Depends(get_current_user),
+    ) -> CurrentUser:
+        if not user.can(permission):
+            raise HTTPException(status_code=403, detail="Not enough permissions")
+        return user
+
+    return check_permission
\ No newline at end of file
@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from sqlalchemy import Row
+from sqlmodel import select
+from app.db.session import session_scope
+from app.models.link import ArticleTagLink
+from app.models.tag import Tag
+
+CSV_COLUMNS = [
+    "id",
+    "title",
+    "content",
+    "published_at",
+    "author_id",
+    "author_name",
+    "category_id",
+    "category_name",
+    "tags",
+]
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+async def export_articles(
+    statement, format: str, batch_size: int, read_only: bool = False
+) -> AsyncIterator[bytes]:
+    """Streams the rows of `statement` as NDJSON or CSV, one chunk per batch.
+
+    `statement` selects the `CSV_COLUMNS` except `tags`. It is read through a
+    server-side cursor and the tag names of each batch are fetched with one
+    query, so memory use depends on `batch_size` rather than the result size.
+    The session is opened here because the body outlives the endpoint call.
+    """
+    encode = _encode_csv if format == "csv" else _encode_ndjson
+    if format == "csv":
+        yield _csv_line(CSV_COLUMNS)
+    async with session_scope(read_only=read_only) as session:
+        result = await session.stream(statement.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            tags = await _tag_names(session, [row.id for row in rows])
+            yield encode(rows, tags)
+
+
+async def _tag_names(session, article_ids: list[int]) -> dict[int, list[str]]:
+    found = await session.exec(
+        select(ArticleTagLink.article_id, Tag.name)
+        .join(Tag)
+        .where(ArticleTagLink.article_id.in_(article_ids))
+        .order_by(Tag.name)
+    )
+    names: dict[int, list[str]] = {}
+    for article_id, name in found:
+        names.setdefault(article_id, []).append(name)
+    return names
+
+
+def _encode_ndjson(rows: Sequence[Row], tags: dict[int, list[str]]) -> bytes:
+    lines = (
+        json.dumps(
+            {
+                "id": row.id,
+                "title": row.title,
+                "content": row.content,
+                "published_at": row.published_at and row.published_at.isoformat(),
+                "author": {"id": row.author_id, "name": row.author_name},
+                "category": {"id": row.category_id, "name": row.category_name},
+                "tags": tags.get(row.id, []),
+            }
+        )
+        for row in rows
+    )
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _csv_line(values) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue().encode()
+
+
+def _encode_csv(rows: Sequence[Row], tags: dict[int, list[str]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        published_at = row.published_at and row.published_at.isoformat()
+        writer.writerow(
+            [
+                row.id,
+                row.title,
+                row.content,
+                published_at,
+                row.author_id,
+                row.author_name,
+                row.category_id,
+                row.category_name,
+                ",".join(tags.get(row.id, [])),
+            ]
+        )
+    return buffer.getvalue().encode()
@@ -0,0 +1,21 @@
+from fastapi import Response
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if settings.FAST_JSON and orjson is None:
+    raise RuntimeError("FAST_JSON=true requires the 'orjson' package")
+
+
+def json_response(content, headers: dict[str, str] | None = None) -> Response:
+    """Serializes already-shaped data with orjson, bypassing `response_model`.
+
+    FastAPI still documents the route's `response_model`, so the OpenAPI
+    schema is the same as on the validated path.
+    """
+    return Response(
+        content=orjson.dumps(content), media_type="application/json", headers=headers
+    )
@@ -0,0 +1,35 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any
+from fastapi import HTTPException
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encodes the sort key of the last row of a page as an opaque cursor."""
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decodes a cursor produced by `encode_cursor` into its sort key values."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def parse_cursor_datetime(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -1,17 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
-from app.api.deps import get_session
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.bulk_import import ArticleImporter, ndjson_lines
+from app.api.cache import article_tagger, cached_route
+from app.api.export import MEDIA_TYPES, export_articles
+from app.api.fast_json import json_response
+from app.api.deps import (
+    get_read_session,
+    get_session,
+    reads_from_replica,
+    require_permission,
+)
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.db.search import search_backend, search_terms
 from app.models.article import (
     Article,
     ArticleCreate,
+    ArticleFacets,
+    ArticleFields,
+    ArticleImportReport,
     ArticleRead,
     ArticleReadWithDetails,
     ArticleUpdate,
 )
 from app.models.author import Author
 from app.models.category import Category
+from app.models.link import ArticleTagLink
+from app.services.articles import (
+    FULL_FIELDS,
+    SUMMARY_FIELDS,
+    article_facets,
+    article_fields,
+    filter_articles,
+    get_article,
+    get_article_row,
+    list_article_rows,
+    list_articles,
+    parse_fields,
+)
+from app.services.latest_feed import latest_feed
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(article_tagger))
 
 
 @router.post(
@@ -19,58 +51,253 @@ router = APIRouter()
     response_model=ArticleRead,
     status_code=201,
     summary="Create a new article (requires authentication)",
+    dependencies=[Depends(require_permission("create_articles"))],
 )
-def create_article(
-    *, session: Session = Depends(get_session), article_in: ArticleCreate
+async def create_article(
+    *, session: AsyncSession = Depends(get_session), article_in: ArticleCreate
 ) -> Article:
     """
     Create a new article with an author and category.
     """
-    author = session.get(Author, article_in.author_id)
+    author = await session.get(Author, article_in.author_id)
     if not author:
         raise HTTPException(status_code=404, detail="Author not found")
-    category = session.get(Category, article_in.category_id)
+    category = await session.get(Category, article_in.category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     db_article = Article.model_validate(article_in)
     session.add(db_article)
-    session.commit()
-    session.refresh(db_article)
+    await session.commit()
+    await session.refresh(db_article)
+    response_cache.invalidate("articles", f"author:{db_article.author_id}")
+    await latest_feed.article_saved(session, db_article)
     return db_article
 
 
+@router.post(
+    "/bulk",
+    response_model=ArticleImportReport,
+    summary="Bulk import articles from NDJSON (requires authentication)",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+    dependencies=[Depends(require_permission("create_articles"))],
+)
+async def import_articles(
+    *, session: AsyncSession = Depends(get_session), request: Request
+) -> ArticleImportReport:
+    """
+    Import articles from a newline-delimited JSON body.
+
+    Each line is an article as accepted by `POST /articles/`, plus an optional
+    `tags` list of tag names; missing tags are created. The body is read as a
+    stream and inserted in transactions of `BULK_IMPORT_CHUNK_SIZE` articles.
+    The report holds the new article ID or the error for every line.
+    """
+    importer = ArticleImporter(session, settings.BULK_IMPORT_CHUNK_SIZE)
+    async for line, raw in ndjson_lines(request.stream()):
+        await importer.add(line, raw)
+    return await importer.finish()
+
+
 @router.get(
-    "/", response_model=list[ArticleReadWithDetails], summary="List all articles"
+    "/",
+    response_model=list[ArticleFields],
+    response_model_exclude_unset=True,
+    summary="List all articles",
 )
-def read_articles(
+async def read_articles(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
+    response: Response,
     offset: int = 0,
-    limit: int = Query(default=100, le=100),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page",
+    ),
     category: str | None = None,
     tags: str | None = Query(
         default=None, description="Comma-separated tag names to filter by"
     ),
     search: str | None = None,
-) -> list[Article]:
+    view: Literal["full", "summary"] = Query(
+        default="full",
+        description="`summary` returns the stored excerpt instead of the content",
+    ),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated fields to return instead of the `view` fields; "
+        "`id` is always included",
+    ),
+) -> list[ArticleFields]:
     """
     Retrieve articles with optional filtering by category, tags, and full-text search.
+
+    Articles are ordered newest first by `(published_at, id)`, or by relevance
+    when searching. When a page is full, the `X-Next-Cursor` response header
+    carries the cursor of the next page. Only the columns of the returned
+    fields are read from the database.
+    """
+    selected = parse_fields(fields) if fields else None
+    if selected is None:
+        selected = SUMMARY_FIELDS if view == "summary" else FULL_FIELDS
+    if latest_feed.enabled and not (category or tags or search or offset):
+        feed_page = await latest_feed.page(limit, cursor, selected)
+        if feed_page is not None:
+            return _feed_response(response, *feed_page)
+    page = dict(
+        category=category,
+        tags=tags,
+        search=search,
+        cursor=cursor,
+        offset=offset,
+        limit=limit,
+        fields=selected,
+    )
+    if settings.FAST_JSON:
+        items, next_cursor = await list_article_rows(session, **page)
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+        return json_response(items, headers=headers)
+    articles, next_cursor = await list_articles(session, **page)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [
+        ArticleFields.model_validate(
+            article_fields(article, selected), from_attributes=True
+        )
+        for article in articles
+    ]
+
+
+@router.get(
+    "/latest",
+    response_model=list[ArticleFields],
+    response_model_exclude_unset=True,
+    summary="List the newest articles",
+)
+async def read_latest_articles(
+    *,
+    session: AsyncSession = Depends(get_read_session),
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page",
+    ),
+    view: Literal["full", "summary"] = Query(
+        default="full",
+        description="`summary` returns the stored excerpt instead of the content",
+    ),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated fields to return instead of the `view` fields; "
+        "`id` is always included",
+    ),
+) -> list[ArticleFields]:
+    """
+    Retrieve the newest articles, ordered by `(published_at, id)`.
+
+    The first `LATEST_FEED_SIZE` articles are served from memory, kept
+    current as articles are created, edited and deleted; later pages are
+    read from the database. Pages and cursors are those of `GET /articles/`
+    without filters.
+    """
+    selected = parse_fields(fields) if fields else None
+    if selected is None:
+        selected = SUMMARY_FIELDS if view == "summary" else FULL_FIELDS
+    feed_page = None
+    if latest_feed.enabled:
+        feed_page = await latest_feed.page(limit, cursor, selected)
+    if feed_page is None:
+        feed_page = await list_article_rows(
+            session, cursor=cursor, limit=limit, fields=selected
+        )
+    return _feed_response(response, *feed_page)
+
+
+def _feed_response(response: Response, items: list[dict], next_cursor: str | None):
+    if settings.FAST_JSON:
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+        return json_response(items, headers=headers)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+
+@router.get(
+    "/facets",
+    response_model=ArticleFacets,
+    summary="Count matching articles per category and tag",
+)
+async def read_article_facets(
+    *,
+    session: AsyncSession = Depends(get_read_session),
+    category: str | None = None,
+    tags: str | None = Query(
+        default=None, description="Comma-separated tag names to filter by"
+    ),
+    search: str | None = None,
+) -> ArticleFacets:
+    """
+    Count the articles matching the same filters as `GET /articles/`, per
+    category and per tag. The category counts ignore `category` and the tag
+    counts ignore `tags`, so they show what each other choice would match.
     """
-    query = select(Article).join(Author).join(Category)
-    if category:
-        query = query.where(Category.name == category)
-    if tags:
-        tag_names = [tag.strip() for tag in tags.split(",")]
-        from app.models.tag import Tag, ArticleTagLink
-
-        query = query.join(ArticleTagLink).join(Tag).where(Tag.name.in_(tag_names))
-    if search:
-        search_term = f"%{search}%"
-        query = query.where(
-            Article.title.ilike(search_term) | Article.content.ilike(search_term)
+    return await article_facets(session, category=category, tags=tags, search=search)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export articles as NDJSON or CSV",
+)
+async def export_articles_stream(
+    *,
+    request: Request,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    category: str | None = None,
+    tags: str | None = Query(
+        default=None, description="Comma-separated tag names to filter by"
+    ),
+    search: str | None = None,
+) -> StreamingResponse:
+    """
+    Stream every article matching the filters, with its author, category
+    and tag names, in ascending ID order.
+    """
+    query = (
+        select(
+            Article.id,
+            Article.title,
+            Article.content,
+            Article.published_at,
+            Article.author_id,
+            Author.name.label("author_name"),
+            Article.category_id,
+            Category.name.label("category_name"),
         )
-    articles = session.exec(query.offset(offset).limit(limit).distinct()).all()
-    return articles
+        .join(Author)
+        .join(Category)
+    )
+    query = filter_articles(query, category, tags)
+    terms = search_terms(search) if search else []
+    if terms:
+        query, _ = search_backend.apply(query, terms)
+    query = query.order_by(Article.id)
+    return StreamingResponse(
+        export_articles(
+            query,
+            format,
+            settings.EXPORT_BATCH_SIZE,
+            read_only=reads_from_replica(request),
+        ),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="articles.{format}"'},
+    )
 
 
 @router.get(
@@ -78,13 +305,18 @@ def read_articles(
     response_model=ArticleReadWithDetails,
     summary="Get a specific article",
 )
-def read_article(
-    *, session: Session = Depends(get_session), article_id: int
+async def read_article(
+    *, session: AsyncSession = Depends(get_read_session), article_id: int
 ) -> Article:
     """
     Get an article by its ID.
     """
-    article = session.get(Article, article_id)
+    if settings.FAST_JSON:
+        row = await get_article_row(session, article_id)
+        if row is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        return json_response(row)
+    article = await get_article(session, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     return article
@@ -94,29 +326,36 @@ def read_article(
     "/{article_id}",
     response_model=ArticleRead,
     summary="Update an article (requires authentication)",
+    dependencies=[Depends(require_permission("edit_articles"))],
 )
-def update_article(
+async def update_article(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     article_id: int,
     article_in: ArticleUpdate,
 ) -> Article:
     """
     Update an article's title, content, or category.
     """
-    db_article = session.get(Article, article_id)
+    db_article = await session.get(Article, article_id)
     if not db_article:
         raise HTTPException(status_code=404, detail="Article not found")
     if article_in.category_id:
-        category = session.get(Category, article_in.category_id)
+        category = await session.get(Category, article_in.category_id)
         if not category:
             raise HTTPException(status_code=404, detail="Category not found")
+    previous_category_id = db_article.category_id
     update_data = article_in.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_article, key, value)
     session.add(db_article)
-    session.commit()
-    session.refresh(db_article)
+    await session.commit()
+    await session.refresh(db_article)
+    stale = {f"article:{article_id}", "articles:search"}
+    if db_article.category_id != previous_category_id:
+        stale.add("articles")
+    response_cache.invalidate(*stale)
+    await latest_feed.article_saved(session, db_article)
     return db_article
 
 
@@ -124,14 +363,31 @@ def update_article(
     "/{article_id}",
     status_code=204,
     summary="Delete an article (requires authentication)",
+    dependencies=[Depends(require_permission("delete_articles"))],
 )
-def delete_article(*, session: Session = Depends(get_session), article_id: int):
+async def delete_article(
+    *, session: AsyncSession = Depends(get_session), article_id: int
+):
     """
     Delete an article by its ID.
     """
-    article = session.get(Article, article_id)
+    article = await session.get(Article, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
-    session.delete(article)
-    session.commit()
+    tag_ids = (
+        await session.exec(
+            select(ArticleTagLink.tag_id).where(ArticleTagLink.article_id == article_id)
+        )
+    ).all()
+    author_id = article.author_id
+    await session.delete(article)
+    await session.commit()
+    # Author and tag details and the facets carry article counts.
+    response_cache.invalidate(
+        "articles",
+        f"article:{article_id}",
+        f"author:{author_id}",
+        *(f"tag:{tag_id}" for tag_id in tag_ids),
+    )
+    latest_feed.article_deleted(article_id)
     return
\ No newline at end of file
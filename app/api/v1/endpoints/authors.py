@@ -1,6 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
-from app.api.deps import get_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.cache import author_tagger, cached_route
+from app.api.deps import get_read_session, get_session, require_permission
+from app.core.cache import response_cache
+from app.models.article import ArticleRead
 from app.models.author import (
     Author,
     AuthorCreate,
@@ -8,37 +12,44 @@ from app.models.author import (
     AuthorUpdate,
     AuthorReadWithArticles,
 )
+from app.services.articles import READ_FIELDS, count_articles, list_articles
+from app.services.latest_feed import latest_feed
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(author_tagger))
 
 
 @router.post(
-    "/", response_model=AuthorRead, status_code=201, summary="Create a new author"
+    "/",
+    response_model=AuthorRead,
+    status_code=201,
+    summary="Create a new author",
+    dependencies=[Depends(require_permission("manage_authors"))],
 )
-def create_author(
-    *, session: Session = Depends(get_session), author_in: AuthorCreate
+async def create_author(
+    *, session: AsyncSession = Depends(get_session), author_in: AuthorCreate
 ) -> Author:
     """
     Create a new author.
     """
     db_author = Author.model_validate(author_in)
     session.add(db_author)
-    session.commit()
-    session.refresh(db_author)
+    await session.commit()
+    await session.refresh(db_author)
+    response_cache.invalidate("authors")
     return db_author
 
 
 @router.get("/", response_model=list[AuthorRead], summary="List all authors")
-def read_authors(
+async def read_authors(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
 ) -> list[Author]:
     """
     Retrieve a list of all authors.
     """
-    authors = session.exec(select(Author).offset(offset).limit(limit)).all()
+    authors = (await session.exec(select(Author).offset(offset).limit(limit))).all()
     return authors
 
 
@@ -47,43 +58,83 @@ def read_authors(
     response_model=AuthorReadWithArticles,
     summary="Get a specific author",
 )
-def read_author(*, session: Session = Depends(get_session), author_id: int) -> Author:
+async def read_author(
+    *,
+    session: AsyncSession = Depends(get_read_session),
+    author_id: int,
+    articles_limit: int = Query(default=20, ge=1, le=100),
+    articles_cursor: str | None = Query(
+        default=None, description="`articles_cursor` of the previous response"
+    ),
+) -> AuthorReadWithArticles:
     """
-    Get an author by their ID, including their articles.
+    Get an author by their ID, with a page of their newest articles and
+    the total number of articles they have written.
     """
-    author = session.get(Author, author_id)
+    author = await session.get(Author, author_id)
     if not author:
         raise HTTPException(status_code=404, detail="Author not found")
-    return author
+    articles, next_cursor = await list_articles(
+        session,
+        author_id=author_id,
+        cursor=articles_cursor,
+        limit=articles_limit,
+        fields=READ_FIELDS,
+    )
+    return AuthorReadWithArticles(
+        **AuthorRead.model_validate(author).model_dump(),
+        articles=[ArticleRead.model_validate(article) for article in articles],
+        article_count=await count_articles(session, author_id=author_id),
+        articles_cursor=next_cursor,
+    )
 
 
-@router.patch("/{author_id}", response_model=AuthorRead, summary="Update an author")
-def update_author(
-    *, session: Session = Depends(get_session), author_id: int, author_in: AuthorUpdate
+@router.patch(
+    "/{author_id}",
+    response_model=AuthorRead,
+    summary="Update an author",
+    dependencies=[Depends(require_permission("manage_authors"))],
+)
+async def update_author(
+    *,
+    session: AsyncSession = Depends(get_session),
+    author_id: int,
+    author_in: AuthorUpdate,
 ) -> Author:
     """
     Update an author's name or bio.
     """
-    db_author = session.get(Author, author_id)
+    db_author = await session.get(Author, author_id)
     if not db_author:
         raise HTTPException(status_code=404, detail="Author not found")
     update_data = author_in.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_author, key, value)
     session.add(db_author)
-    session.commit()
-    session.refresh(db_author)
+    await session.commit()
+    await session.refresh(db_author)
+    response_cache.invalidate(f"author:{author_id}")
+    latest_feed.reset()
     return db_author
 
 
-@router.delete("/{author_id}", status_code=204, summary="Delete an author")
-def delete_author(*, session: Session = Depends(get_session), author_id: int):
+@router.delete(
+    "/{author_id}",
+    status_code=204,
+    summary="Delete an author",
+    dependencies=[Depends(require_permission("manage_authors"))],
+)
+async def delete_author(
+    *, session: AsyncSession = Depends(get_session), author_id: int
+):
     """
     Delete an author.
     """
-    author = session.get(Author, author_id)
+    author = await session.get(Author, author_id)
     if not author:
         raise HTTPException(status_code=404, detail="Author not found")
-    session.delete(author)
-    session.commit()
+    await session.delete(author)
+    await session.commit()
+    response_cache.invalidate(f"author:{author_id}")
+    latest_feed.reset()
     return
\ No newline at end of file
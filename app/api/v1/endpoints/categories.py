@@ -1,22 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
-from app.api.deps import get_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.cache import cached_route, category_tagger
+from app.api.deps import get_read_session, get_session, require_permission
+from app.core.cache import response_cache
 from app.models.category import Category, CategoryCreate, CategoryRead, CategoryUpdate
+from app.services.categories import list_categories
+from app.services.latest_feed import latest_feed
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(category_tagger))
 
 
 @router.post(
-    "/", response_model=CategoryRead, status_code=201, summary="Create a new category"
+    "/",
+    response_model=CategoryRead,
+    status_code=201,
+    summary="Create a new category",
+    dependencies=[Depends(require_permission("manage_taxonomy"))],
 )
-def create_category(
-    *, session: Session = Depends(get_session), category_in: CategoryCreate
+async def create_category(
+    *, session: AsyncSession = Depends(get_session), category_in: CategoryCreate
 ) -> Category:
     """
     Create a new category for articles.
     """
-    existing_category = session.exec(
-        select(Category).where(Category.name == category_in.name)
+    existing_category = (
+        await session.exec(select(Category).where(Category.name == category_in.name))
     ).first()
     if existing_category:
         raise HTTPException(
@@ -24,80 +33,101 @@ def create_category(
         )
     db_category = Category.model_validate(category_in)
     session.add(db_category)
-    session.commit()
-    session.refresh(db_category)
+    await session.commit()
+    await session.refresh(db_category)
+    response_cache.invalidate("categories", f"category-name:{db_category.name}")
     return db_category
 
 
 @router.get("/", response_model=list[CategoryRead], summary="List all categories")
-def read_categories(
+async def read_categories(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     offset: int = 0,
     limit: int = Query(default=50, le=100),
 ) -> list[Category]:
     """
     Retrieve a list of all available categories.
     """
-    categories = session.exec(select(Category).offset(offset).limit(limit)).all()
-    return categories
+    return await list_categories(session, offset, limit)
 
 
 @router.get(
     "/{category_id}", response_model=CategoryRead, summary="Get a specific category"
 )
-def read_category(
-    *, session: Session = Depends(get_session), category_id: int
+async def read_category(
+    *, session: AsyncSession = Depends(get_read_session), category_id: int
 ) -> Category:
     """
     Get a category by its ID.
     """
-    category = session.get(Category, category_id)
+    category = await session.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     return category
 
 
 @router.patch(
-    "/{category_id}", response_model=CategoryRead, summary="Update a category"
+    "/{category_id}",
+    response_model=CategoryRead,
+    summary="Update a category",
+    dependencies=[Depends(require_permission("manage_taxonomy"))],
 )
-def update_category(
+async def update_category(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     category_id: int,
     category_in: CategoryUpdate,
 ) -> Category:
     """
     Update a category's name or description.
     """
-    db_category = session.get(Category, category_id)
+    db_category = await session.get(Category, category_id)
     if not db_category:
         raise HTTPException(status_code=404, detail="Category not found")
     if category_in.name:
-        existing = session.exec(
-            select(Category).where(Category.name == category_in.name)
+        existing = (
+            await session.exec(
+                select(Category).where(Category.name == category_in.name)
+            )
         ).first()
         if existing and existing.id != category_id:
             raise HTTPException(
                 status_code=409, detail="Another category with this name already exists"
             )
+    previous_name = db_category.name
     update_data = category_in.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_category, key, value)
     session.add(db_category)
-    session.commit()
-    session.refresh(db_category)
+    await session.commit()
+    await session.refresh(db_category)
+    response_cache.invalidate(
+        f"category:{category_id}",
+        f"category-name:{previous_name}",
+        f"category-name:{db_category.name}",
+    )
+    latest_feed.reset()
     return db_category
 
 
-@router.delete("/{category_id}", status_code=204, summary="Delete a category")
-def delete_category(*, session: Session = Depends(get_session), category_id: int):
+@router.delete(
+    "/{category_id}",
+    status_code=204,
+    summary="Delete a category",
+    dependencies=[Depends(require_permission("manage_taxonomy"))],
+)
+async def delete_category(
+    *, session: AsyncSession = Depends(get_session), category_id: int
+):
     """
     Delete a category.
     """
-    category = session.get(Category, category_id)
+    category = await session.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
-    session.delete(category)
-    session.commit()
+    await session.delete(category)
+    await session.commit()
+    response_cache.invalidate(f"category:{category_id}")
+    latest_feed.reset()
     return
\ No newline at end of file
@@ -1,9 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlmodel import Session, select, SQLModel
+from sqlmodel import select, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import timedelta
 from app.api.deps import get_session
-from app.core.security import create_access_token, verify_password
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    create_access_token,
+    get_password_hash_async,
+    needs_rehash,
+    verify_password_async,
+)
 from app.core.config import settings
 from app.models.user import User
 
@@ -16,18 +23,30 @@ class Token(SQLModel):
 
 
 @router.post("/login/access-token", response_model=Token)
-def login_access_token(
-    session: Session = Depends(get_session),
+async def login_access_token(
+    session: AsyncSession = Depends(get_session),
     form_data: OAuth2PasswordRequestForm = Depends(),
 ):
     """
     OAuth2 compatible token login, get an access token for future requests.
     """
-    user = session.exec(select(User).where(User.email == form_data.username)).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = (
+        await session.exec(select(User).where(User.email == form_data.username))
+    ).first()
+    # Return the connection to the pool while the password is checked.
+    await session.commit()
+    if not user:
+        # Hash anyway, so an unknown email is not answered faster.
+        await verify_password_async(form_data.password, DUMMY_PASSWORD_HASH)
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
+    if not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(status_code=400, detail="Incorrect email or password")
     elif not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    if needs_rehash(user.hashed_password):
+        user.hashed_password = await get_password_hash_async(form_data.password)
+        session.add(user)
+        await session.commit()
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
         "access_token": create_access_token(
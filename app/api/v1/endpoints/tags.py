@@ -1,80 +1,135 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
-from app.api.deps import get_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.cache import cached_route, tag_tagger
+from app.api.deps import get_read_session, get_session, require_permission
+from app.core.cache import response_cache
+from app.models.article import ArticleRead
 from app.models.tag import Tag, TagCreate, TagRead, TagUpdate, TagReadWithArticles
+from app.services.articles import READ_FIELDS, count_articles, list_articles
+from app.services.latest_feed import latest_feed
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(tag_tagger))
 
 
-@router.post("/", response_model=TagRead, status_code=201, summary="Create a new tag")
-def create_tag(*, session: Session = Depends(get_session), tag_in: TagCreate) -> Tag:
+@router.post(
+    "/",
+    response_model=TagRead,
+    status_code=201,
+    summary="Create a new tag",
+    dependencies=[Depends(require_permission("manage_taxonomy"))],
+)
+async def create_tag(
+    *, session: AsyncSession = Depends(get_session), tag_in: TagCreate
+) -> Tag:
     """
     Create a new tag.
     """
-    existing_tag = session.exec(select(Tag).where(Tag.name == tag_in.name)).first()
+    existing_tag = (
+        await session.exec(select(Tag).where(Tag.name == tag_in.name))
+    ).first()
     if existing_tag:
         raise HTTPException(status_code=409, detail="Tag with this name already exists")
     db_tag = Tag.model_validate(tag_in)
     session.add(db_tag)
-    session.commit()
-    session.refresh(db_tag)
+    await session.commit()
+    await session.refresh(db_tag)
+    response_cache.invalidate("tags", f"tag-name:{db_tag.name}")
     return db_tag
 
 
 @router.get("/", response_model=list[TagRead], summary="List all tags")
-def read_tags(
+async def read_tags(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
 ) -> list[Tag]:
     """
     Retrieve a list of all tags.
     """
-    tags = session.exec(select(Tag).offset(offset).limit(limit)).all()
+    tags = (await session.exec(select(Tag).offset(offset).limit(limit))).all()
     return tags
 
 
 @router.get(
     "/{tag_id}", response_model=TagReadWithArticles, summary="Get a specific tag"
 )
-def read_tag(*, session: Session = Depends(get_session), tag_id: int) -> Tag:
+async def read_tag(
+    *,
+    session: AsyncSession = Depends(get_read_session),
+    tag_id: int,
+    articles_limit: int = Query(default=20, ge=1, le=100),
+    articles_cursor: str | None = Query(
+        default=None, description="`articles_cursor` of the previous response"
+    ),
+) -> TagReadWithArticles:
     """
-    Get a tag by its ID, including associated articles.
+    Get a tag by its ID, with a page of the newest articles carrying it and
+    the total number of such articles.
     """
-    tag = session.get(Tag, tag_id)
+    tag = await session.get(Tag, tag_id)
     if not tag:
         raise HTTPException(status_code=404, detail="Tag not found")
-    return tag
+    articles, next_cursor = await list_articles(
+        session,
+        tag_id=tag_id,
+        cursor=articles_cursor,
+        limit=articles_limit,
+        fields=READ_FIELDS,
+    )
+    return TagReadWithArticles(
+        **TagRead.model_validate(tag).model_dump(),
+        articles=[ArticleRead.model_validate(article) for article in articles],
+        article_count=await count_articles(session, tag_id=tag_id),
+        articles_cursor=next_cursor,
+    )
 
 
-@router.patch("/{tag_id}", response_model=TagRead, summary="Update a tag")
-def update_tag(
-    *, session: Session = Depends(get_session), tag_id: int, tag_in: TagUpdate
+@router.patch(
+    "/{tag_id}",
+    response_model=TagRead,
+    summary="Update a tag",
+    dependencies=[Depends(require_permission("manage_taxonomy"))],
+)
+async def update_tag(
+    *, session: AsyncSession = Depends(get_session), tag_id: int, tag_in: TagUpdate
 ) -> Tag:
     """
     Update a tag's name or description.
     """
-    db_tag = session.get(Tag, tag_id)
+    db_tag = await session.get(Tag, tag_id)
     if not db_tag:
         raise HTTPException(status_code=404, detail="Tag not found")
+    previous_name = db_tag.name
     update_data = tag_in.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_tag, key, value)
     session.add(db_tag)
-    session.commit()
-    session.refresh(db_tag)
+    await session.commit()
+    await session.refresh(db_tag)
+    response_cache.invalidate(
+        f"tag:{tag_id}", f"tag-name:{previous_name}", f"tag-name:{db_tag.name}"
+    )
+    latest_feed.reset()
     return db_tag
 
 
-@router.delete("/{tag_id}", status_code=204, summary="Delete a tag")
-def delete_tag(*, session: Session = Depends(get_session), tag_id: int):
+@router.delete(
+    "/{tag_id}",
+    status_code=204,
+    summary="Delete a tag",
+    dependencies=[Depends(require_permission("manage_taxonomy"))],
+)
+async def delete_tag(*, session: AsyncSession = Depends(get_session), tag_id: int):
     """
     Delete a tag.
     """
-    tag = session.get(Tag, tag_id)
+    tag = await session.get(Tag, tag_id)
     if not tag:
         raise HTTPException(status_code=404, detail="Tag not found")
-    session.delete(tag)
-    session.commit()
+    await session.delete(tag)
+    await session.commit()
+    response_cache.invalidate(f"tag:{tag_id}")
+    latest_feed.reset()
     return
\ No newline at end of file
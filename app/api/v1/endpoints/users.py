@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.api.deps import get_session
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 from app.models.user import User, UserCreate, UserRead, Role
 
 router = APIRouter()
@@ -10,28 +11,34 @@ router = APIRouter()
 @router.post(
     "/", response_model=UserRead, status_code=201, summary="Register a new user"
 )
-def create_user(
-    *, session: Session = Depends(get_session), user_in: UserCreate
+async def create_user(
+    *, session: AsyncSession = Depends(get_session), user_in: UserCreate
 ) -> User:
     """
     Create new user.
     """
-    db_user = session.exec(select(User).where(User.email == user_in.email)).first()
+    # Hash before the lookups so no pooled connection is held meanwhile.
+    hashed_password = await get_password_hash_async(user_in.password)
+    db_user = (
+        await session.exec(select(User).where(User.email == user_in.email))
+    ).first()
     if db_user:
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system.",
         )
-    reader_role = session.exec(select(Role).where(Role.name == "reader")).first()
+    reader_role = (
+        await session.exec(select(Role).where(Role.name == "reader"))
+    ).first()
     if not reader_role:
         raise HTTPException(status_code=500, detail="Default reader role not found")
     user = User(
         email=user_in.email,
         full_name=user_in.full_name,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=hashed_password,
         roles=[reader_role],
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
+    await session.refresh(user)
     return user
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""API-only ASGI entry point for workers that never serve Reflex pages.
+
+    uvicorn app.api_app:create_api_app --factory
+
+Routers, models and the database layer are imported when the app is built,
+not when this module is, and startup only initializes the database when
+the stored schema version is behind.
+"""
+
+from fastapi import FastAPI, Response
+from starlette.middleware.cors import CORSMiddleware
+from app.core.config import settings
+
+
+def create_api_app() -> FastAPI:
+    from app.api.v1.api import api_router
+    from app.core.compression import CompressionMiddleware
+    from app.core.metrics import MetricsMiddleware, render_metrics
+    from app.core.request_context import RequestContextMiddleware
+    from app.db.init_db import init_db
+
+    api = FastAPI(
+        title=settings.PROJECT_NAME,
+        openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        version=settings.PROJECT_VERSION,
+        docs_url="/docs",
+        redoc_url="/redoc",
+    )
+    if settings.BACKEND_CORS_ORIGINS:
+        api.add_middleware(
+            CORSMiddleware,
+            allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+            expose_headers=["X-Next-Cursor"],
+        )
+    api.add_middleware(RequestContextMiddleware)
+    api.add_middleware(CompressionMiddleware)
+    api.add_middleware(MetricsMiddleware)
+
+    @api.on_event("startup")
+    def on_startup():
+        init_db()
+
+    @api.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(render_metrics(), media_type="text/plain; version=0.0.4")
+
+    api.include_router(api_router, prefix=settings.API_V1_STR)
+    return api
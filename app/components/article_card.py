@@ -1,8 +1,8 @@
 import reflex as rx
-from app.models.article import ArticleReadWithDetails
+from app.models.article import ArticleSummary
 
 
-def article_card(article: ArticleReadWithDetails) -> rx.Component:
+def article_card(article: ArticleSummary) -> rx.Component:
     """Component to display a single article card."""
     return rx.el.div(
         rx.el.div(
@@ -31,7 +31,7 @@ def article_card(article: ArticleReadWithDetails) -> rx.Component:
             class_name="flex items-start justify-between gap-4",
         ),
         rx.el.p(
-            f"{article['content'].to_string()[:150]}...",
+            article["excerpt"],
             class_name="text-gray-700 mt-2 text-sm leading-relaxed",
         ),
         rx.el.div(
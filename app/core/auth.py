@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from jose import JWTError, jwt
+from sqlalchemy import event
+from sqlalchemy.orm import Session, selectinload
+from sqlmodel import select
+from app.core.config import settings
+from app.models.user import Permission, Role, RolePermissionLink, User, UserRoleLink
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    id: int
+    uuid: str
+    email: str
+    is_active: bool
+    is_admin: bool
+    permissions: frozenset[str]
+
+    def can(self, permission: str) -> bool:
+        return self.is_admin or permission in self.permissions
+
+
+class AuthCache:
+    """Caches what it takes to turn a bearer token into a CurrentUser.
+
+    Decoded tokens and resolved users are kept in LRUs bounded by
+    `max_entries`; users also expire after `ttl` seconds, which bounds how
+    long another worker's role changes go unseen. The role to permission
+    map is loaded with one query and kept until a role or permission
+    changes. Session flush hooks drop the affected entries in this process.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._tokens: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._users: OrderedDict[str, tuple[CurrentUser, float]] = OrderedDict()
+        self._role_permissions: dict[int, frozenset[str]] | None = None
+        self._lock = threading.Lock()
+
+    def decode(self, token: str) -> str | None:
+        """Returns the user UUID a valid, unexpired token was issued for."""
+        now = time.time()
+        with self._lock:
+            cached = self._tokens.get(token)
+            if cached is not None:
+                self._tokens.move_to_end(token)
+        if cached is None:
+            try:
+                payload = jwt.decode(
+                    token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+                )
+            except JWTError:
+                return None
+            if not isinstance(payload.get("sub"), str):
+                return None
+            cached = (payload["sub"], float(payload.get("exp", now)))
+            self._put(self._tokens, token, cached)
+        subject, expires_at = cached
+        return subject if expires_at > now else None
+
+    async def user(self, session, user_uuid: str) -> CurrentUser | None:
+        with self._lock:
+            cached = self._users.get(user_uuid)
+            if cached is not None:
+                self._users.move_to_end(user_uuid)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        user = (
+            await session.exec(
+                select(User)
+                .where(User.uuid == user_uuid)
+                .options(selectinload(User.roles))
+            )
+        ).first()
+        if user is None:
+            return None
+        role_permissions = await self.role_permissions(session)
+        current = CurrentUser(
+            id=user.id,
+            uuid=user.uuid,
+            email=user.email,
+            is_active=user.is_active,
+            is_admin=user.is_admin,
+            permissions=frozenset().union(
+                *(role_permissions.get(role.id, frozenset()) for role in user.roles)
+            ),
+        )
+        self._put(self._users, user_uuid, (current, time.monotonic() + self.ttl))
+        return current
+
+    async def role_permissions(self, session) -> dict[int, frozenset[str]]:
+        role_permissions = self._role_permissions
+        if role_permissions is None:
+            rows = await session.exec(
+                select(RolePermissionLink.role_id, Permission.name).join(Permission)
+            )
+            grouped: dict[int, set[str]] = {}
+            for role_id, name in rows:
+                grouped.setdefault(role_id, set()).add(name)
+            role_permissions = {k: frozenset(v) for k, v in grouped.items()}
+            self._role_permissions = role_permissions
+        return role_permissions
+
+    def invalidate_user(self, user_uuid: str) -> None:
+        with self._lock:
+            self._users.pop(user_uuid, None)
+
+    def invalidate_users(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+    def invalidate_roles(self) -> None:
+        with self._lock:
+            self._role_permissions = None
+            self._users.clear()
+
+    def _put(self, lru: OrderedDict, key, value) -> None:
+        with self._lock:
+            lru[key] = value
+            lru.move_to_end(key)
+            while len(lru) > self.max_entries:
+                lru.popitem(last=False)
+
+
+auth_cache = AuthCache(settings.AUTH_CACHE_MAX_ENTRIES, settings.AUTH_CACHE_TTL_SECONDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_auth_cache(session, flush_context) -> None:
+    changed = [*session.new, *session.dirty, *session.deleted]
+    if any(isinstance(obj, (Role, Permission, RolePermissionLink)) for obj in changed):
+        auth_cache.invalidate_roles()
+    elif any(isinstance(obj, UserRoleLink) for obj in changed):
+        auth_cache.invalidate_users()
+    else:
+        for obj in changed:
+            if isinstance(obj, User):
+                auth_cache.invalidate_user(obj.uuid)
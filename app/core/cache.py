@@ -0,0 +1,284 @@
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from app.core.config import settings
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    status_code: int
+    headers: dict[str, str]
+    media_type: str | None
+    tags: frozenset[str] = frozenset()
+    expires_at: float = 0.0
+    # The body compressed in each Content-Encoding it has been served in.
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(body) for body in self.encoded.values())
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class MemoryCacheBackend:
+    """In-process LRU bounded by entry count and total body size."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, keep_ttl: bool = False) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            for tag in entry.tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys |= self._keys_by_tag.get(tag, set())
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._bytes = 0
+
+    def usage(self) -> tuple[int, int]:
+        return len(self._entries), self._bytes
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+class RedisCacheBackend:
+    """Shared backend; TTL and eviction are delegated to Redis itself.
+
+    Each tag is a Redis set holding the keys of the entries that carry it.
+    """
+
+    prefix = "response-cache:"
+
+    def __init__(self, url: str, ttl: int):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis requires the 'redis' package"
+            ) from e
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.evictions = 0
+
+    def get(self, key: str) -> CacheEntry | None:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return CacheEntry(
+            body=base64.b64decode(data["body"]),
+            status_code=data["status_code"],
+            headers=data["headers"],
+            media_type=data["media_type"],
+            tags=frozenset(data["tags"]),
+            encoded={
+                encoding: base64.b64decode(body)
+                for encoding, body in data.get("encoded", {}).items()
+            },
+        )
+
+    def set(self, key: str, entry: CacheEntry, keep_ttl: bool = False) -> None:
+        data = {
+            "body": base64.b64encode(entry.body).decode(),
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "media_type": entry.media_type,
+            "tags": sorted(entry.tags),
+            "encoded": {
+                encoding: base64.b64encode(body).decode()
+                for encoding, body in entry.encoded.items()
+            },
+        }
+        if keep_ttl:
+            # Only over the live entry, whose tags are already registered: an
+            # entry that expired or was invalidated meanwhile is not revived
+            # without a TTL.
+            self.client.set(self.prefix + key, json.dumps(data), keepttl=True, xx=True)
+            return
+        pipe = self.client.pipeline()
+        pipe.set(self.prefix + key, json.dumps(data), ex=self.ttl)
+        for tag in entry.tags:
+            pipe.sadd(self.prefix + "tag:" + tag, key)
+            pipe.expire(self.prefix + "tag:" + tag, self.ttl)
+        pipe.execute()
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        tag_keys = [self.prefix + "tag:" + tag for tag in tags]
+        keys = self.client.sunion(tag_keys) if tag_keys else set()
+        pipe = self.client.pipeline()
+        for key in keys:
+            pipe.delete(self.prefix + key.decode())
+        pipe.delete(*tag_keys)
+        pipe.execute()
+        return len(keys)
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+    def usage(self) -> tuple[int, int]:
+        return 0, 0
+
+
+@dataclass
+class ResponseCache:
+    """Caches serialized GET responses, invalidated by the tags they carry.
+
+    Tags name the rows a response was built from (`article:5`, `category:2`)
+    or a collection whose membership it depends on (`articles`), so a write
+    only drops the entries that could have changed.
+    """
+
+    backend: MemoryCacheBackend | RedisCacheBackend | None
+    ttl: int
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    generation: int = 0
+    invalidated_at: float = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get(self, key: str) -> CacheEntry | None:
+        if self.backend is None:
+            return None
+        entry = self.backend.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def peek(self, key: str) -> CacheEntry | None:
+        """Looks an entry up without counting a hit or a miss."""
+        if self.backend is None:
+            return None
+        return self.backend.get(key)
+
+    def set(self, key: str, entry: CacheEntry, generation: int) -> None:
+        """Stores an entry unless an invalidation ran since `generation`.
+
+        A response computed before a concurrent write committed would
+        otherwise be cached after that write invalidated its tags.
+        """
+        if self.backend is None or generation != self.generation:
+            return
+        entry.expires_at = time.monotonic() + self.ttl
+        self.backend.set(key, entry)
+
+    def add_encoding(
+        self, key: str, entry: CacheEntry, encoding: str, body: bytes, generation: int
+    ) -> None:
+        """Stores a compressed body beside a cached entry, keeping its expiry."""
+        if self.backend is None or generation != self.generation:
+            return
+        self.backend.set(
+            key,
+            replace(entry, encoded={**entry.encoded, encoding: body}),
+            keep_ttl=True,
+        )
+
+    def invalidate(self, *tags: str) -> None:
+        # Bumped without a backend too: coalesced requests are keyed by it.
+        self.generation += 1
+        self.invalidated_at = time.monotonic()
+        if self.backend is None:
+            return
+        self.invalidations += self.backend.invalidate(set(tags))
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.generation += 1
+            self.backend.clear()
+
+    def stats(self) -> CacheStats:
+        if self.backend is None:
+            return CacheStats()
+        entries, size = self.backend.usage()
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.backend.evictions,
+            invalidations=self.invalidations,
+            entries=entries,
+            bytes=size,
+        )
+
+
+def create_response_cache() -> ResponseCache:
+    ttl = settings.RESPONSE_CACHE_TTL_SECONDS
+    if settings.RESPONSE_CACHE_BACKEND == "memory":
+        backend = MemoryCacheBackend(
+            settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_MAX_BYTES
+        )
+    elif settings.RESPONSE_CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(settings.RESPONSE_CACHE_REDIS_URL, ttl)
+    else:
+        backend = None
+    return ResponseCache(backend=backend, ttl=ttl)
+
+
+response_cache = create_response_cache()
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, TypeVar
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalescingStats:
+    # Calls that ran the computation, and calls served another call's result.
+    leaders: int = 0
+    coalesced: int = 0
+    timeouts: int = 0
+
+
+class _LeaderCancelled(Exception):
+    pass
+
+
+@dataclass
+class _Flight:
+    future: asyncio.Future
+    deadline: float
+
+
+class RequestCoalescer:
+    """Shares one in-flight computation between concurrent calls with the same key.
+
+    The first call for a key runs it; calls arriving while it runs wait for
+    its result, or for its exception, instead of running their own. Each
+    flight has a deadline `timeout` seconds after it started: a waiter
+    still waiting then, or arriving later, runs the computation itself, as
+    does every waiter of a leader that was cancelled.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.stats = CoalescingStats()
+        self._flights: dict[Hashable, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def run(
+        self, key: Hashable, compute: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        """Returns the result for `key` and whether it came from another call."""
+        flight = self._flights.get(key)
+        if flight is not None:
+            remaining = flight.deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                result = await asyncio.wait_for(
+                    asyncio.shield(flight.future), remaining
+                )
+            except asyncio.TimeoutError:
+                self.stats.timeouts += 1
+            except _LeaderCancelled:
+                pass
+            except Exception:
+                self.stats.coalesced += 1
+                raise
+            else:
+                self.stats.coalesced += 1
+                return result, True
+            return await compute(), False
+        flight = _Flight(
+            asyncio.get_running_loop().create_future(),
+            time.monotonic() + self.timeout,
+        )
+        self._flights[key] = flight
+        self.stats.leaders += 1
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            flight.future.set_exception(_LeaderCancelled())
+            raise
+        except Exception as e:
+            flight.future.set_exception(e)
+            raise
+        else:
+            flight.future.set_result(result)
+            return result, False
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if flight.future.done() and not flight.future.cancelled():
+                # Marks the exception retrieved when nobody was waiting.
+                flight.future.exception()
+
+
+request_coalescer = RequestCoalescer(settings.COALESCE_TIMEOUT_SECONDS)
@@ -0,0 +1,204 @@
+import os
+import time
+import zlib
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# (busy, normal, cached) levels. Cached bodies are compressed once and
+# served many times, so they get the slowest level the CPU can spare.
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 5, 9), "zstd": (1, 3, 10)}
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+# Bodies at least this large are compressed on a worker thread.
+THREAD_MIN_SIZE = 256 * 1024
+_LOAD_CHECK_SECONDS = 1.0
+
+
+def available_encodings() -> list[str]:
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [e for e in settings.COMPRESSION_ENCODINGS if installed.get(e)]
+
+
+ENCODINGS = available_encodings()
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """Picks the encoding with the highest q-value, ties going to ENCODINGS order."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                continue
+        weights[name.strip().lower()] = q
+    best, best_q = None, 0.0
+    for encoding in ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compressible(media_type: str | None) -> bool:
+    if not media_type:
+        return False
+    media_type = media_type.split(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type.endswith("+json")
+        or media_type in COMPRESSIBLE_TYPES
+    )
+
+
+class _LoadMonitor:
+    """Reports whether the host is busy, re-reading the load average once a second."""
+
+    def __init__(self):
+        self.checked_at = 0.0
+        self.busy = False
+
+    def is_busy(self) -> bool:
+        now = time.monotonic()
+        if now - self.checked_at >= _LOAD_CHECK_SECONDS:
+            self.checked_at = now
+            try:
+                load = os.getloadavg()[0] / (os.cpu_count() or 1)
+            except (AttributeError, OSError):
+                load = 0.0
+            self.busy = load >= settings.COMPRESSION_BUSY_LOAD
+        return self.busy
+
+
+load_monitor = _LoadMonitor()
+
+
+def compression_level(encoding: str, cached: bool = False) -> int:
+    """The level for `encoding`, dropping to the fastest when the CPU is busy."""
+    busy, normal, best = LEVELS[encoding]
+    if load_monitor.is_busy():
+        return normal if cached else busy
+    return best if cached else normal
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self.compressor.finish()
+
+
+def compressor(encoding: str, level: int):
+    """A streaming compressor with zlib's `compress`/`flush` interface."""
+    if encoding == "gzip":
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if encoding == "br":
+        return _BrotliCompressor(level)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    raise ValueError(f"Unsupported encoding {encoding!r}")
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    c = compressor(encoding, level)
+    return c.compress(body) + c.flush()
+
+
+async def compress_body(body: bytes, encoding: str, level: int) -> bytes:
+    """Compresses `body`, on a worker thread when it is large."""
+    if len(body) >= THREAD_MIN_SIZE:
+        return await anyio.to_thread.run_sync(compress, body, encoding, level)
+    return compress(body, encoding, level)
+
+
+class CompressionMiddleware:
+    """Compresses responses in the best encoding the client accepts.
+
+    Bodies below COMPRESSION_MIN_SIZE, non-text media types and responses
+    that already carry a Content-Encoding (such as precompressed cache
+    hits) are sent as they are. Streamed responses are compressed chunk
+    by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int | None = None):
+        self.app = app
+        self.minimum_size = (
+            settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        start: Message | None = None
+        stream = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, stream, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if stream is not None:
+                chunk = stream.compress(body)
+                if not more_body:
+                    chunk += stream.flush()
+                await send({**message, "body": chunk})
+                return
+            headers = MutableHeaders(scope=start)
+            if (
+                "content-encoding" in headers
+                or start["status"] in (204, 304)
+                or not compressible(headers.get("content-type"))
+                or (not more_body and len(body) < self.minimum_size)
+            ):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+            headers["Content-Encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+                stream = compressor(encoding, compression_level(encoding))
+                await send(start)
+                await send({**message, "body": stream.compress(body)})
+                return
+            body = await compress_body(body, encoding, compression_level(encoding))
+            headers["Content-Length"] = str(len(body))
+            await send(start)
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_wrapper)
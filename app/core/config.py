@@ -8,7 +8,62 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "a-very-secret-key-that-should-be-in-an-env-file"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
     ALGORITHM: str = "HS256"
+    # Decoded tokens and resolved users kept per process by get_current_user.
+    AUTH_CACHE_MAX_ENTRIES: int = 4096
+    AUTH_CACHE_TTL_SECONDS: float = 60.0
+    # scrypt cost; hashes made with other parameters are upgraded on login.
+    SCRYPT_N: int = 2**14
+    SCRYPT_R: int = 8
+    SCRYPT_P: int = 1
+    PASSWORD_HASH_WORKERS: int = 0  # 0 uses one thread per CPU
+    # Hashing jobs that may wait for a worker before logins get a 503.
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:8000"]
+    # Serve requests on an asyncio engine; false runs the sync engine on threads.
+    DB_ASYNC: bool = True
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # Postgres only; 0 disables
+    # GET endpoints read from these replicas; writes always use REFLEX_DB_URL.
+    DATABASE_REPLICA_URLS: list[str] = []
+    DB_REPLICA_STRATEGY: str = "round_robin"  # or "least_busy"
+    # Clients read from the primary for this long after a write request.
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+    # Log statements at or above the threshold, and this fraction of all others.
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_SAMPLE_RATE: float = 0.0
+    # Build hot article responses from row tuples and encode them with orjson,
+    # skipping response_model validation.
+    FAST_JSON: bool = False
+    RESPONSE_CACHE_BACKEND: str = "memory"  # "memory", "redis" or "none"
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    # Concurrent identical GETs on cached routes share one computation; a
+    # waiter gives up and runs its own after the timeout.
+    COALESCE_REQUESTS: bool = True
+    COALESCE_TIMEOUT_SECONDS: float = 5.0
+    # Response encodings in order of preference; br and zstd also need the
+    # brotli and zstandard packages and are skipped without them.
+    COMPRESSION_ENCODINGS: list[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_MIN_SIZE: int = 1024
+    # Load average per CPU above which responses use the fastest level.
+    COMPRESSION_BUSY_LOAD: float = 0.75
+    # Newest articles kept in memory for GET /articles/latest and the unfiltered
+    # article list; 0 reads every page from the database. Reloaded after the
+    # TTL so writes handled by other workers show up.
+    LATEST_FEED_SIZE: int = 200
+    LATEST_FEED_TTL_SECONDS: float = 60.0
+    # Articles inserted per transaction by the bulk import endpoint.
+    BULK_IMPORT_CHUNK_SIZE: int = 1000
+    # Rows fetched per round trip by the streaming export endpoint.
+    EXPORT_BATCH_SIZE: int = 1000
 
     class Config:
         case_sensitive = True
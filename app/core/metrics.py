@@ -0,0 +1,159 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.request_context import route_template
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestStats:
+    db_queries: int = 0
+    db_seconds: float = 0.0
+
+
+@dataclass
+class RouteMetrics:
+    requests_by_status: dict[int, int] = field(default_factory=dict)
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * len(LATENCY_BUCKETS)
+    )
+    latency_sum: float = 0.0
+    latency_count: int = 0
+    db_queries: int = 0
+    db_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+# Keyed by (method, route template). Only the event loop thread writes here,
+# from MetricsMiddleware, so updates need no lock.
+route_metrics: dict[tuple[str, str], RouteMetrics] = {}
+
+
+def record_db_query(seconds: float) -> None:
+    """Adds one statement to the stats of the request that issued it."""
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_seconds += seconds
+
+
+class MetricsMiddleware:
+    """Records request count, latency and database usage per route template."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            elapsed = time.perf_counter() - start
+            key = (scope["method"], route_template(scope) or "<unmatched>")
+            metrics = route_metrics.get(key)
+            if metrics is None:
+                metrics = route_metrics[key] = RouteMetrics()
+            metrics.requests_by_status[status_code] = (
+                metrics.requests_by_status.get(status_code, 0) + 1
+            )
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if elapsed <= bound:
+                    metrics.latency_buckets[i] += 1
+                    break
+            metrics.latency_sum += elapsed
+            metrics.latency_count += 1
+            metrics.db_queries += stats.db_queries
+            metrics.db_seconds += stats.db_seconds
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def render_metrics() -> str:
+    """Renders all metrics in the Prometheus text exposition format."""
+    from app.core.cache import response_cache
+    from app.core.coalescing import request_coalescer
+    from app.services.latest_feed import latest_feed
+
+    lines = [
+        "# HELP http_requests_total Requests handled, by route template and status.",
+        "# TYPE http_requests_total counter",
+    ]
+    items = sorted(route_metrics.items())
+    for (method, route), m in items:
+        for status, count in sorted(m.requests_by_status.items()):
+            labels = _labels(method=method, route=route, status=status)
+            lines.append(f"http_requests_total{labels} {count}")
+    lines += [
+        "# HELP http_request_duration_seconds Request latency, by route template.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (method, route), m in items:
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, m.latency_buckets):
+            cumulative += count
+            labels = _labels(method=method, route=route, le=bound)
+            lines.append(f"http_request_duration_seconds_bucket{labels} {cumulative}")
+        labels = _labels(method=method, route=route, le="+Inf")
+        lines.append(f"http_request_duration_seconds_bucket{labels} {m.latency_count}")
+        labels = _labels(method=method, route=route)
+        lines.append(f"http_request_duration_seconds_sum{labels} {m.latency_sum}")
+        lines.append(f"http_request_duration_seconds_count{labels} {m.latency_count}")
+    lines += [
+        "# HELP db_queries_total Database statements executed, by route template.",
+        "# TYPE db_queries_total counter",
+    ]
+    for (method, route), m in items:
+        labels = _labels(method=method, route=route)
+        lines.append(f"db_queries_total{labels} {m.db_queries}")
+    lines += [
+        "# HELP db_query_seconds_total Time spent in database statements.",
+        "# TYPE db_query_seconds_total counter",
+    ]
+    for (method, route), m in items:
+        labels = _labels(method=method, route=route)
+        lines.append(f"db_query_seconds_total{labels} {m.db_seconds}")
+    cache = response_cache.stats()
+    feed = latest_feed.stats
+    coalescing = request_coalescer.stats
+    for name, value, kind in (
+        ("response_cache_hits_total", cache.hits, "counter"),
+        ("response_cache_misses_total", cache.misses, "counter"),
+        ("response_cache_evictions_total", cache.evictions, "counter"),
+        ("response_cache_invalidations_total", cache.invalidations, "counter"),
+        ("response_cache_entries", cache.entries, "gauge"),
+        ("response_cache_bytes", cache.bytes, "gauge"),
+        ("latest_feed_hits_total", feed.hits, "counter"),
+        ("latest_feed_misses_total", feed.misses, "counter"),
+        ("latest_feed_loads_total", feed.loads, "counter"),
+        ("latest_feed_articles", feed.size, "gauge"),
+        ("coalesced_requests_total", coalescing.coalesced, "counter"),
+        ("coalescing_leaders_total", coalescing.leaders, "counter"),
+        ("coalescing_timeouts_total", coalescing.timeouts, "counter"),
+        ("coalescing_in_flight", request_coalescer.in_flight, "gauge"),
+    ):
+        lines += [f"# TYPE {name} {kind}", f"{name} {value}"]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,47 @@
+from contextvars import ContextVar
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_request_scope: ContextVar[Scope | None] = ContextVar("request_scope", default=None)
+
+
+class RequestContextMiddleware:
+    """Makes the ASGI scope of the current request visible to lower layers.
+
+    The router fills in `scope["route"]` after this middleware has run, so
+    the scope is stored rather than the route itself and resolved on demand.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
+
+
+def current_request_scope() -> Scope | None:
+    return _request_scope.get()
+
+
+def route_template(scope: Scope) -> str | None:
+    """Returns the matched route template, e.g. `/api/v1/articles/{article_id}`."""
+    route = scope.get("route")
+    if route is None:
+        return None
+    path = scope["path"]
+    if route.path_regex.match(path):
+        return route.path
+    # Routers included without flattening only know the path below their
+    # prefix; recover the prefix from the same number of trailing segments.
+    return path.rsplit("/", route.path.count("/"))[0] + route.path
+
+
+def current_route() -> str | None:
+    scope = _request_scope.get()
+    return route_template(scope) if scope is not None else None
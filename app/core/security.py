@@ -1,10 +1,17 @@
 from datetime import datetime, timedelta, timezone
+import asyncio
 import hashlib
+import hmac
+import os
 import secrets
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
 from jose import jwt
 from app.core.config import settings
 import logging
 
+SCRYPT_PREFIX = "scrypt"
+
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     if expires_delta:
@@ -20,18 +27,104 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None) ->
     return encoded_jwt
 
 
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=2 * 128 * n * r * p,
+        dklen=32,
+    )
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verifies a password against a hash using SHA256 and salt."""
+    """Verifies a password against an scrypt hash or a legacy salted SHA256 one."""
     try:
+        if hashed_password.startswith(SCRYPT_PREFIX + "$"):
+            _, n, r, p, salt, pwd_hash = hashed_password.split("$")
+            computed = _scrypt(
+                plain_password, bytes.fromhex(salt), int(n), int(r), int(p)
+            )
+            return hmac.compare_digest(computed.hex(), pwd_hash)
         salt, pwd_hash = hashed_password.split("$")
-        return pwd_hash == hashlib.sha256((plain_password + salt).encode()).hexdigest()
+        computed = hashlib.sha256((plain_password + salt).encode()).hexdigest()
+        return hmac.compare_digest(computed, pwd_hash)
     except (ValueError, TypeError) as e:
         logging.exception(f"Error verifying password: {e}")
         return False
 
 
 def get_password_hash(password: str) -> str:
-    """Hashes a password using SHA256 with a random salt."""
-    salt = secrets.token_hex(16)
-    pwd_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-    return f"{salt}${pwd_hash}"
\ No newline at end of file
+    """Hashes a password using scrypt with a random salt."""
+    n, r, p = settings.SCRYPT_N, settings.SCRYPT_R, settings.SCRYPT_P
+    salt = secrets.token_bytes(16)
+    pwd_hash = _scrypt(password, salt, n, r, p).hex()
+    return f"{SCRYPT_PREFIX}${n}${r}${p}${salt.hex()}${pwd_hash}"
+
+
+# Verified when no user has the email, so that takes as long as a wrong
+# password. Only the cost parameters matter; the digest is never matched.
+DUMMY_PASSWORD_HASH = (
+    f"{SCRYPT_PREFIX}${settings.SCRYPT_N}${settings.SCRYPT_R}${settings.SCRYPT_P}$"
+    f"{secrets.token_bytes(16).hex()}${'0' * 64}"
+)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Whether a hash is legacy SHA256 or uses other than the current scrypt cost."""
+    current = (
+        f"{SCRYPT_PREFIX}${settings.SCRYPT_N}${settings.SCRYPT_R}${settings.SCRYPT_P}$"
+    )
+    return not hashed_password.startswith(current)
+
+
+class PasswordHashPool:
+    """Runs password hashing on dedicated threads with bounded admission.
+
+    scrypt releases the GIL, so a thread per core runs in parallel without
+    tying up the threadpool that serves requests. Once `max_pending` jobs
+    are running or queued, new ones are refused with a 503 straight away
+    rather than queueing logins behind a burst.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.max_pending = workers + max_queue
+        self.pending = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+
+    async def run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Too many concurrent logins, try again shortly",
+                headers={
+                    "Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)
+                },
+            )
+        self.pending += 1
+        try:
+            return await asyncio.wrap_future(self._executor.submit(fn, *args))
+        finally:
+            self.pending -= 1
+
+
+password_hash_pool = PasswordHashPool(
+    settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1,
+    settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hash_pool.run(get_password_hash, password)
\ No newline at end of file
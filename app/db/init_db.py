@@ -1,4 +1,5 @@
-from sqlmodel import SQLModel, Session, select
+from sqlmodel import Session, select
+from app.db.migrations import SCHEMA_VERSION, migrate, stored_schema_version
 from app.db.session import engine
 from app.models.author import Author
 from app.models.category import Category
@@ -9,8 +10,16 @@ from app.core.security import get_password_hash
 from datetime import datetime
 
 
+def init_db() -> None:
+    """Migrates the schema unless its version is current, then seeds it if empty."""
+    if stored_schema_version() != SCHEMA_VERSION:
+        create_db_and_tables()
+    # Even when current: `python -m app.db.migrations` does not seed.
+    create_initial_data()
+
+
 def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
+    migrate(engine)
 
 
 def create_initial_data():
@@ -29,15 +38,28 @@ def create_initial_data():
             perm_admin_read = Permission(
                 name="admin_read", description="Read admin dashboard"
             )
+            perm_taxonomy = Permission(
+                name="manage_taxonomy", description="Manage categories and tags"
+            )
+            perm_authors = Permission(
+                name="manage_authors", description="Manage author profiles"
+            )
             role_admin = Role(
                 name="admin",
                 description="Administrator",
-                permissions=[perm_admin_read, perm_create, perm_edit, perm_delete],
+                permissions=[
+                    perm_admin_read,
+                    perm_create,
+                    perm_edit,
+                    perm_delete,
+                    perm_taxonomy,
+                    perm_authors,
+                ],
             )
             role_author = Role(
                 name="author",
                 description="Article Author",
-                permissions=[perm_create, perm_edit, perm_delete],
+                permissions=[perm_create, perm_edit, perm_delete, perm_taxonomy],
             )
             role_reader = Role(name="reader", description="Regular Reader")
             user_admin = User(
@@ -71,6 +93,8 @@ def create_initial_data():
                     perm_edit,
                     perm_delete,
                     perm_admin_read,
+                    perm_taxonomy,
+                    perm_authors,
                 ]
             )
             session.commit()
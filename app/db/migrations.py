@@ -0,0 +1,195 @@
+"""Versioned schema changes, applied in order by `migrate`.
+
+    python -m app.db.migrations
+
+Migration 1 creates the tables of the current models, so on a new
+database later migrations find their change already made; each one must
+therefore be a no-op when that is the case. Append new migrations to
+MIGRATIONS with the next version number; never edit a released one.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable
+from sqlalchemy import bindparam, inspect, insert, text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlmodel import SQLModel, delete, select
+import app.models  # noqa: F401  (registers every table on SQLModel.metadata)
+from app.db.search import search_backend
+from app.db.session import engine
+from app.models.article import Article, make_excerpt
+from app.models.schema_version import SchemaVersion
+from app.models.user import Permission, Role, RolePermissionLink
+
+logger = logging.getLogger(__name__)
+
+EXCERPT_BACKFILL_BATCH_SIZE = 1000
+# Serializes migrations between workers starting at once (Postgres only).
+MIGRATION_LOCK_ID = 7_351_902
+# Index name -> (table, columns). `{nulls}` follows published_at DESC: list
+# queries order NULLs last, which is Postgres' ascending but not descending
+# default, and SQLite's order for DESC already.
+ARTICLE_INDEXES = {
+    "ix_article_published_at_id": ("article", "published_at DESC{nulls}, id DESC"),
+    "ix_article_author_id_published_at_id": (
+        "article",
+        "author_id, published_at DESC{nulls}, id DESC",
+    ),
+    "ix_article_category_id_published_at_id": (
+        "article",
+        "category_id, published_at DESC{nulls}, id DESC",
+    ),
+    "ix_articletaglink_tag_id_article_id": ("articletaglink", "tag_id, article_id"),
+}
+# Permission -> (description, roles granted it), as create_initial_data seeds them.
+TAXONOMY_PERMISSIONS = {
+    "manage_taxonomy": ("Manage categories and tags", ("admin", "author")),
+    "manage_authors": ("Manage author profiles", ("admin",)),
+}
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+def create_tables(connection: Connection) -> None:
+    SQLModel.metadata.create_all(connection)
+    search_backend.create_index(connection)
+
+
+def add_article_excerpt(connection: Connection) -> None:
+    columns = {c["name"] for c in inspect(connection).get_columns("article")}
+    if "excerpt" in columns:
+        return
+    connection.execute(
+        text("ALTER TABLE article ADD COLUMN excerpt VARCHAR NOT NULL DEFAULT ''")
+    )
+    last_id = 0
+    while rows := connection.execute(
+        select(Article.id, Article.content)
+        .where(Article.id > last_id)
+        .order_by(Article.id)
+        .limit(EXCERPT_BACKFILL_BATCH_SIZE)
+    ).all():
+        connection.execute(
+            update(Article.__table__).where(Article.__table__.c.id == bindparam("_id")),
+            [{"_id": id, "excerpt": make_excerpt(content)} for id, content in rows],
+        )
+        last_id = rows[-1].id
+
+
+def add_article_indexes(connection: Connection) -> None:
+    nulls = " NULLS LAST" if connection.dialect.name == "postgresql" else ""
+    for name, (table, columns) in ARTICLE_INDEXES.items():
+        connection.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS {name} "
+                f"ON {table} ({columns.format(nulls=nulls)})"
+            )
+        )
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("ANALYZE article"))
+        connection.execute(text("ANALYZE articletaglink"))
+    else:
+        connection.execute(text("ANALYZE"))
+
+
+def add_taxonomy_permissions(connection: Connection) -> None:
+    roles = dict(
+        connection.execute(
+            select(Role.name, Role.id).where(Role.name.in_(["admin", "author"]))
+        ).all()
+    )
+    if not roles:
+        # Not seeded yet; create_initial_data grants them with the roles.
+        return
+    for name, (description, role_names) in TAXONOMY_PERMISSIONS.items():
+        permission_id = connection.execute(
+            select(Permission.id).where(Permission.name == name)
+        ).scalar()
+        if permission_id is None:
+            permission_id = connection.execute(
+                insert(Permission).values(name=name, description=description)
+            ).inserted_primary_key[0]
+        linked = set(
+            connection.execute(
+                select(RolePermissionLink.role_id).where(
+                    RolePermissionLink.permission_id == permission_id
+                )
+            ).scalars()
+        )
+        for role_name in role_names:
+            role_id = roles.get(role_name)
+            if role_id is not None and role_id not in linked:
+                connection.execute(
+                    insert(RolePermissionLink).values(
+                        role_id=role_id, permission_id=permission_id
+                    )
+                )
+
+
+MIGRATIONS = [
+    Migration(1, "Create tables and the search index", create_tables),
+    Migration(2, "Add article.excerpt and fill it from content", add_article_excerpt),
+    Migration(
+        3,
+        "Index the article list, tag filter and author detail paths",
+        add_article_indexes,
+    ),
+    Migration(
+        4,
+        "Grant manage_taxonomy and manage_authors to the admin and author roles",
+        add_taxonomy_permissions,
+    ),
+]
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def stored_schema_version(bind: Engine | Connection = engine) -> int | None:
+    """The last applied migration, or None before the schema table exists."""
+    try:
+        if isinstance(bind, Connection):
+            # A savepoint, so a missing table does not abort the transaction.
+            with bind.begin_nested():
+                return bind.execute(select(SchemaVersion.version)).scalar()
+        with bind.connect() as connection:
+            return connection.execute(select(SchemaVersion.version)).scalar()
+    except (OperationalError, ProgrammingError):
+        return None
+
+
+def migrate(bind: Engine = engine) -> list[Migration]:
+    """Applies the pending migrations, each in its own transaction.
+
+    The stored version is advanced with each migration, so a failure leaves
+    the database at the last migration that completed.
+    """
+    applied = []
+    for migration in MIGRATIONS:
+        if (stored_schema_version(bind) or 0) >= migration.version:
+            continue
+        with bind.begin() as connection:
+            if connection.dialect.name == "postgresql":
+                connection.execute(
+                    text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID}
+                )
+                if (stored_schema_version(connection) or 0) >= migration.version:
+                    continue
+            migration.apply(connection)
+            connection.execute(delete(SchemaVersion))
+            connection.execute(insert(SchemaVersion).values(version=migration.version))
+        logger.info(
+            "Applied migration %s: %s", migration.version, migration.description
+        )
+        applied.append(migration)
+    return applied
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    applied = migrate()
+    print(f"Schema at version {SCHEMA_VERSION}; applied {len(applied)} migration(s)")
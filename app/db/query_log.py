@@ -0,0 +1,43 @@
+import logging
+import random
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.metrics import record_db_query
+from app.core.request_context import current_route
+
+logger = logging.getLogger("app.db.slow_query")
+
+
+def install_query_hooks(
+    engine: Engine, threshold_ms: float, sample_rate: float
+) -> None:
+    """Times every statement for the request metrics and the slow-query log.
+
+    The log covers statements slower than `threshold_ms`, plus a random
+    sample of the rest. A threshold of 0 disables the threshold and a
+    sample rate of 0 disables sampling.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        record_db_query(elapsed)
+        elapsed_ms = elapsed * 1000
+        if threshold_ms > 0 and elapsed_ms >= threshold_ms:
+            level = logging.WARNING
+        elif sample_rate > 0 and random.random() < sample_rate:
+            level = logging.INFO
+        else:
+            return
+        logger.log(
+            level,
+            "%.1fms route=%s statement=%s",
+            elapsed_ms,
+            current_route() or "-",
+            " ".join(statement.split()),
+        )
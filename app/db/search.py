@@ -0,0 +1,141 @@
+import re
+from sqlalchemy import Float, cast, column, func, literal_column, table, text
+from sqlalchemy.engine import Connection, Engine
+from app.db.session import engine
+from app.models.article import Article
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_terms(query: str) -> list[str]:
+    """Splits free text into lowercase word terms, dropping query syntax."""
+    return _TERM_RE.findall(query.lower())
+
+
+class SearchBackend:
+    """Filters and ranks an article query by a free-text search term."""
+
+    def create_index(self, connection: Connection) -> None:
+        pass
+
+    def apply(self, query, terms: list[str]):
+        """Returns the filtered query and a relevance score (higher is better)."""
+        raise NotImplementedError
+
+
+class LikeSearchBackend(SearchBackend):
+    """Unindexed substring match, used for databases without a full-text engine."""
+
+    def apply(self, query, terms):
+        for term in terms:
+            pattern = f"%{term}%"
+            query = query.where(
+                Article.title.ilike(pattern) | Article.content.ilike(pattern)
+            )
+        return query, None
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Ranks with ts_rank over a stored tsvector column backed by a GIN index.
+
+    The column is generated from title and content, so Postgres keeps it
+    current on every insert and update without application involvement.
+    """
+
+    def create_index(self, connection):
+        connection.execute(
+            text(
+                "ALTER TABLE article ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                "GENERATED ALWAYS AS ("
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+                ") STORED"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_article_search_vector "
+                "ON article USING GIN (search_vector)"
+            )
+        )
+
+    def apply(self, query, terms):
+        tsquery = func.to_tsquery(
+            literal_column("'english'::regconfig"),
+            " & ".join(f"{term}:*" for term in terms),
+        )
+        vector = literal_column("article.search_vector")
+        query = query.where(vector.op("@@")(tsquery))
+        # ts_rank is a real; as double precision the score round-trips
+        # through the cursor exactly, so the next page resumes after it.
+        return query, cast(func.ts_rank(vector, tsquery), Float(53))
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """Ranks with bm25 over an external-content FTS5 table.
+
+    Triggers on the article table keep the index in step with inserts,
+    updates and deletes.
+    """
+
+    fts = table("article_fts", column("rowid"))
+
+    def create_index(self, connection):
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'article_fts'")
+        ).first()
+        if exists:
+            return
+        connection.execute(
+            text(
+                "CREATE VIRTUAL TABLE article_fts USING fts5("
+                "title, content, content='article', content_rowid='id', "
+                "tokenize='porter unicode61')"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE TRIGGER article_fts_ai AFTER INSERT ON article BEGIN "
+                "INSERT INTO article_fts(rowid, title, content) "
+                "VALUES (new.id, new.title, new.content); END"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE TRIGGER article_fts_ad AFTER DELETE ON article BEGIN "
+                "INSERT INTO article_fts(article_fts, rowid, title, content) "
+                "VALUES ('delete', old.id, old.title, old.content); END"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE TRIGGER article_fts_au AFTER UPDATE OF title, content "
+                "ON article BEGIN "
+                "INSERT INTO article_fts(article_fts, rowid, title, content) "
+                "VALUES ('delete', old.id, old.title, old.content); "
+                "INSERT INTO article_fts(rowid, title, content) "
+                "VALUES (new.id, new.title, new.content); END"
+            )
+        )
+        connection.execute(
+            text("INSERT INTO article_fts(article_fts) VALUES ('rebuild')")
+        )
+
+    def apply(self, query, terms):
+        match = " ".join(f'"{term}"*' for term in terms)
+        query = query.join(self.fts, self.fts.c.rowid == Article.id).where(
+            literal_column("article_fts").op("MATCH")(match)
+        )
+        # bm25 is lower-is-better; title matches weigh ten times body matches.
+        return query, -func.bm25(literal_column("article_fts"), 10.0, 1.0)
+
+
+def get_search_backend(bind: Engine) -> SearchBackend:
+    if bind.dialect.name == "postgresql":
+        return PostgresSearchBackend()
+    if bind.dialect.name == "sqlite":
+        return SQLiteSearchBackend()
+    return LikeSearchBackend()
+
+
+search_backend = get_search_backend(engine)
@@ -1,6 +1,18 @@
 from sqlmodel import create_engine, Session
 import os
 from urllib.parse import quote_plus
+import itertools
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator
+import anyio
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.query_log import install_query_hooks
 
 DB_USER = os.getenv("DB_USER", "user")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "password")
@@ -10,9 +22,213 @@ DATABASE_URL = os.getenv(
     "REFLEX_DB_URL",
     f"postgresql://{quote_plus(DB_USER)}:{quote_plus(DB_PASSWORD)}@{DB_HOST}/{DB_NAME}",
 )
-engine = create_engine(DATABASE_URL, echo=True)
+ASYNC_DRIVERS = {"postgresql": "postgresql+psycopg", "sqlite": "sqlite+aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """Swaps the driver of a sync database URL for its asyncio counterpart."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.drivername}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def engine_options(url: str) -> dict:
+    """Builds create_engine keyword arguments from the DB_* settings."""
+    parsed = make_url(url)
+    options = {"echo": settings.DB_ECHO, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        # In-memory SQLite lives in a single connection; there is no pool to size.
+        return options
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    )
+    if parsed.get_backend_name() == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS:
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+        }
+    return options
+
+
+def create_engines(url: str) -> tuple[Engine, AsyncEngine | None]:
+    """Creates the sync engine for `url` and, with DB_ASYNC, its async twin."""
+    sync_engine = create_engine(url, **engine_options(url))
+    async_engine = (
+        create_async_engine(async_database_url(url), **engine_options(url))
+        if settings.DB_ASYNC
+        else None
+    )
+    for bind in (sync_engine, async_engine and async_engine.sync_engine):
+        if bind is not None:
+            install_query_hooks(
+                bind, settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_SAMPLE_RATE
+            )
+    return sync_engine, async_engine
+
+
+engine, async_engine = create_engines(DATABASE_URL)
+replica_engines = [create_engines(url) for url in settings.DATABASE_REPLICA_URLS]
+
+
+class ReplicaRouter:
+    """Chooses the replica that serves each read-only session.
+
+    `round_robin` cycles through the replicas; `least_busy` takes the one
+    with the fewest open sessions, rotating between replicas that tie.
+    Sessions are opened and closed on the event loop, so the counters are
+    only touched from one thread.
+    """
+
+    def __init__(self, count: int, strategy: str):
+        if strategy not in ("round_robin", "least_busy"):
+            raise ValueError(f"Unknown replica strategy {strategy!r}")
+        self.strategy = strategy
+        self.open_sessions = [0] * count
+        self._turn = itertools.count()
+
+    def pick(self) -> int | None:
+        count = len(self.open_sessions)
+        if not count:
+            return None
+        turn = next(self._turn) % count
+        if self.strategy == "round_robin":
+            return turn
+        return min(
+            range(count), key=lambda i: (self.open_sessions[i], (i - turn) % count)
+        )
+
+
+replica_router = ReplicaRouter(len(replica_engines), settings.DB_REPLICA_STRATEGY)
+
+
+def _session_slots(bind: Engine) -> anyio.Semaphore:
+    # ThreadedSessions that may hold a pooled connection at once. A slot is
+    # taken before the session first runs on a worker thread, so threads never
+    # block on pool checkout while the sessions holding connections wait for
+    # a free thread.
+    if isinstance(bind.pool, QueuePool):
+        return anyio.Semaphore(settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    return anyio.Semaphore(1)
+
+
+_threaded_session_slots = {
+    bind: _session_slots(bind) for bind in [engine] + [r for r, _ in replica_engines]
+}
 
 
 def get_session():
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+class ThreadedSession:
+    """Runs a synchronous Session on the threadpool behind the AsyncSession API.
+
+    This is the `DB_ASYNC=false` path: endpoints are written against
+    AsyncSession and every database round trip is awaited, but each one
+    is executed by a worker thread using the sync driver.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    def add(self, instance) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+
+    async def exec(self, statement, **kwargs):
+        kwargs.setdefault("execution_options", {"prebuffer_rows": True})
+        return await run_in_threadpool(
+            partial(self.sync_session.exec, statement, **kwargs)
+        )
+
+    async def execute(self, statement, params=None, **kwargs):
+        kwargs.setdefault("execution_options", {"prebuffer_rows": True})
+        return await run_in_threadpool(
+            partial(self.sync_session.execute, statement, params, **kwargs)
+        )
+
+    async def stream(self, statement, **kwargs) -> "ThreadedResult":
+        result = await run_in_threadpool(
+            partial(self.sync_session.execute, statement, **kwargs)
+        )
+        return ThreadedResult(result)
+
+    async def scalar(self, statement, **kwargs):
+        return await run_in_threadpool(
+            partial(self.sync_session.scalar, statement, **kwargs)
+        )
+
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(
+            partial(self.sync_session.get, entity, ident, **kwargs)
+        )
+
+    async def refresh(self, instance, **kwargs) -> None:
+        await run_in_threadpool(partial(self.sync_session.refresh, instance, **kwargs))
+
+    async def delete(self, instance) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self) -> None:
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+class ThreadedResult:
+    """Fetches a streamed sync Result on the threadpool, like AsyncResult."""
+
+    def __init__(self, result):
+        self.result = result
+
+    async def partitions(self, size: int | None = None):
+        partitions = self.result.partitions(size)
+        while (rows := await run_in_threadpool(next, partitions, None)) is not None:
+            yield rows
+
+
+@asynccontextmanager
+async def session_scope(read_only: bool = False) -> AsyncIterator[AsyncSession]:
+    """Opens a session on the async engine, or a ThreadedSession without one.
+
+    With `read_only`, the session is bound to a replica picked by
+    `replica_router` when DATABASE_REPLICA_URLS is set.
+    """
+    replica = replica_router.pick() if read_only else None
+    if replica is None:
+        sync_bind, async_bind = engine, async_engine
+    else:
+        sync_bind, async_bind = replica_engines[replica]
+        replica_router.open_sessions[replica] += 1
+    try:
+        if async_bind is not None:
+            async with AsyncSession(async_bind, expire_on_commit=False) as session:
+                yield session
+        else:
+            async with _threaded_session_slots[sync_bind]:
+                session = ThreadedSession(Session(sync_bind, expire_on_commit=False))
+                try:
+                    yield session
+                finally:
+                    await session.close()
+    finally:
+        if replica is not None:
+            replica_router.open_sessions[replica] -= 1
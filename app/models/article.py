@@ -1,4 +1,5 @@
 from typing import Optional
+from sqlalchemy import event, inspect
 from sqlmodel import Field, SQLModel, Relationship
 from datetime import datetime
 from app.models.author import AuthorRead
@@ -6,6 +7,20 @@ from app.models.category import CategoryRead
 from app.models.tag import TagRead
 from app.models.link import ArticleTagLink
 
+# Characters of content kept in Article.excerpt; changing it needs a backfill.
+EXCERPT_LENGTH = 150
+
+
+def make_excerpt(content: str) -> str:
+    """Collapses whitespace and cuts `content` at a word boundary."""
+    text = " ".join(content.split())
+    if len(text) <= EXCERPT_LENGTH:
+        return text
+    cut = text[:EXCERPT_LENGTH]
+    if " " in cut:
+        cut = cut[: cut.rindex(" ")]
+    return cut.rstrip(",;:.-") + "..."
+
 
 class ArticleBase(SQLModel):
     title: str
@@ -19,6 +34,7 @@ class Article(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     content: str
+    excerpt: str = ""
     published_at: Optional[datetime] = Field(
         default_factory=datetime.utcnow, nullable=True
     )
@@ -31,11 +47,38 @@ class Article(SQLModel, table=True):
     )
 
 
+@event.listens_for(Article, "before_insert")
+def _set_excerpt_on_insert(mapper, connection, target: Article) -> None:
+    target.excerpt = make_excerpt(target.content)
+
+
+@event.listens_for(Article, "before_update")
+def _set_excerpt_on_update(mapper, connection, target: Article) -> None:
+    if inspect(target).attrs.content.history.has_changes():
+        target.excerpt = make_excerpt(target.content)
+
+
 class ArticleCreate(ArticleBase):
     author_id: int
     category_id: int
 
 
+class ArticleImport(ArticleCreate):
+    tags: list[str] = []
+
+
+class ArticleImportResult(SQLModel):
+    line: int
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ArticleImportReport(SQLModel):
+    created: int = 0
+    failed: int = 0
+    results: list[ArticleImportResult] = []
+
+
 class ArticleRead(ArticleBase):
     id: int
     author_id: int
@@ -48,6 +91,48 @@ class ArticleReadWithDetails(ArticleRead):
     tags: list[TagRead] = []
 
 
+class ArticleSummary(SQLModel):
+    """An article as listed, with its excerpt in place of the content."""
+
+    id: int
+    title: str
+    excerpt: str
+    published_at: Optional[datetime] = None
+    author_id: int
+    category_id: int
+    author: AuthorRead
+    category: CategoryRead
+    tags: list[TagRead] = []
+
+
+class ArticleFields(SQLModel):
+    """A list item holding only the fields chosen with `fields=`."""
+
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    excerpt: Optional[str] = None
+    published_at: Optional[datetime] = None
+    author_id: Optional[int] = None
+    category_id: Optional[int] = None
+    author: Optional[AuthorRead] = None
+    category: Optional[CategoryRead] = None
+    tags: Optional[list[TagRead]] = None
+
+
+class FacetCount(SQLModel):
+    id: int
+    name: str
+    count: int
+
+
+class ArticleFacets(SQLModel):
+    """Matching articles per category and per tag, most frequent first."""
+
+    categories: list[FacetCount] = []
+    tags: list[FacetCount] = []
+
+
 class ArticleUpdate(SQLModel):
     title: Optional[str] = None
     content: Optional[str] = None
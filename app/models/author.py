@@ -24,7 +24,10 @@ class AuthorRead(AuthorBase):
 
 
 class AuthorReadWithArticles(AuthorRead):
+    # The newest articles; pass articles_cursor back to get the next page.
     articles: list["ArticleRead"] = []
+    article_count: int = 0
+    articles_cursor: Optional[str] = None
 
 
 class AuthorUpdate(SQLModel):
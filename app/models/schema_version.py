@@ -0,0 +1,7 @@
+from typing import Optional
+from sqlmodel import Field, SQLModel
+
+
+class SchemaVersion(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    version: int
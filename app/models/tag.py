@@ -32,4 +32,7 @@ class TagUpdate(SQLModel):
 
 
 class TagReadWithArticles(TagRead):
-    articles: list["ArticleRead"] = []
\ No newline at end of file
+    # The newest articles; pass articles_cursor back to get the next page.
+    articles: list["ArticleRead"] = []
+    article_count: int = 0
+    articles_cursor: Optional[str] = None
\ No newline at end of file
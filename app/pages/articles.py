@@ -2,6 +2,36 @@ import reflex as rx
 from app.states.articles_state import ArticlesState
 from app.components.article_card import article_card
 
+# Wait for a pause in typing before searching, rather than on every keystroke.
+SEARCH_DEBOUNCE_MS = 300
+LOAD_MORE_ID = "load-more-articles"
+# Clicks the load-more button once it comes within this distance of the
+# viewport, so the next page is requested before the reader reaches the end.
+# The button is re-observed whenever the number of loaded cards changes,
+# which re-fires the observer if it is still in range after a short page.
+LOAD_MORE_MARGIN_PX = 800
+INFINITE_SCROLL_SCRIPT = f"""
+(() => {{
+  if (window.__articlesScroll) return;
+  const observer = new IntersectionObserver((entries) => {{
+    for (const entry of entries) if (entry.isIntersecting) entry.target.click();
+  }}, {{ rootMargin: "{LOAD_MORE_MARGIN_PX}px 0px" }});
+  const state = (window.__articlesScroll = {{ el: null, loaded: null }});
+  const attach = () => {{
+    const el = document.getElementById("{LOAD_MORE_ID}");
+    if (el === state.el && (!el || el.dataset.loaded === state.loaded)) return;
+    if (state.el) observer.unobserve(state.el);
+    state.el = el;
+    state.loaded = el && el.dataset.loaded;
+    if (el) observer.observe(el);
+  }};
+  new MutationObserver(attach).observe(document.body, {{
+    childList: true, subtree: true, attributes: true, attributeFilter: ["data-loaded"],
+  }});
+  attach();
+}})();
+"""
+
 
 def articles_page_header() -> rx.Component:
     return rx.el.header(
@@ -31,10 +61,14 @@ def articles_filters() -> rx.Component:
                     rx.icon("search", class_name="h-5 w-5 text-gray-400"),
                     class_name="absolute inset-y-0 left-0 flex items-center pl-3 pointer-events-none",
                 ),
-                rx.el.input(
-                    placeholder="Search articles...",
-                    on_change=ArticlesState.set_search_query,
-                    class_name="w-full pl-10 pr-4 py-2 border border-gray-300 rounded-lg focus:ring-blue-500 focus:border-blue-500",
+                rx.debounce_input(
+                    rx.el.input(
+                        placeholder="Search articles...",
+                        value=ArticlesState.search_query,
+                        on_change=ArticlesState.set_search_query,
+                        class_name="w-full pl-10 pr-4 py-2 border border-gray-300 rounded-lg focus:ring-blue-500 focus:border-blue-500",
+                    ),
+                    debounce_timeout=SEARCH_DEBOUNCE_MS,
                 ),
                 class_name="relative w-full max-w-sm",
             ),
@@ -42,7 +76,13 @@ def articles_filters() -> rx.Component:
                 rx.el.option("All Categories", value=""),
                 rx.foreach(
                     ArticlesState.categories,
-                    lambda c: rx.el.option(c["name"], value=c["name"]),
+                    lambda c: rx.el.option(
+                        c["name"]
+                        + " ("
+                        + ArticlesState.category_counts.get(c["name"], 0).to_string()
+                        + ")",
+                        value=c["name"],
+                    ),
                 ),
                 on_change=ArticlesState.set_selected_category,
                 value=ArticlesState.selected_category,
@@ -54,6 +94,33 @@ def articles_filters() -> rx.Component:
     )
 
 
+def load_more_footer() -> rx.Component:
+    return rx.el.div(
+        rx.cond(
+            ArticlesState.is_loading_more,
+            rx.el.div(
+                rx.icon(
+                    "loader-circle", class_name="h-6 w-6 text-gray-400 animate-spin"
+                ),
+                class_name="flex justify-center",
+            ),
+            rx.cond(
+                ArticlesState.has_more,
+                rx.el.button(
+                    "Load more articles",
+                    id=LOAD_MORE_ID,
+                    data_loaded=ArticlesState.articles.length()
+                    + ArticlesState.hidden_count,
+                    on_click=ArticlesState.load_more,
+                    class_name="mx-auto block px-4 py-2 text-sm font-semibold text-blue-600 hover:underline",
+                ),
+                None,
+            ),
+        ),
+        class_name="py-8",
+    )
+
+
 def articles_list() -> rx.Component:
     return rx.el.div(
         rx.cond(
@@ -71,8 +138,27 @@ def articles_list() -> rx.Component:
                 class_name="grid grid-cols-1 md:grid-cols-2 gap-6",
             ),
             rx.el.div(
-                rx.foreach(ArticlesState.articles, article_card),
-                class_name="grid grid-cols-1 md:grid-cols-2 gap-6",
+                rx.cond(
+                    ArticlesState.hidden_count > 0,
+                    rx.el.div(
+                        rx.el.span(
+                            ArticlesState.hidden_count.to_string()
+                            + " earlier articles hidden. ",
+                        ),
+                        rx.el.button(
+                            "Back to the newest",
+                            on_click=ArticlesState.fetch_articles_and_categories,
+                            class_name="font-semibold text-blue-600 hover:underline",
+                        ),
+                        class_name="text-center text-sm text-gray-600 mb-6",
+                    ),
+                    None,
+                ),
+                rx.el.div(
+                    rx.foreach(ArticlesState.articles, article_card),
+                    class_name="grid grid-cols-1 md:grid-cols-2 gap-6",
+                ),
+                load_more_footer(),
             ),
         ),
         rx.cond(
@@ -101,6 +187,7 @@ def articles() -> rx.Component:
         articles_page_header(),
         articles_filters(),
         articles_list(),
+        rx.script(INFINITE_SCROLL_SCRIPT),
         on_mount=ArticlesState.fetch_articles_and_categories,
         class_name="bg-gray-50 min-h-screen font-['Inter']",
     )
\ No newline at end of file
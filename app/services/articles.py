@@ -0,0 +1,388 @@
+from fastapi import HTTPException
+from sqlalchemy import and_, exists, func, literal, tuple_, union_all
+from sqlalchemy.orm import contains_eager, joinedload, load_only, selectinload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.pagination import decode_cursor, encode_cursor, parse_cursor_datetime
+from app.db.search import search_backend, search_terms
+from app.models.article import (
+    Article,
+    ArticleFacets,
+    ArticleReadWithDetails,
+    FacetCount,
+)
+from app.models.author import Author, AuthorRead
+from app.models.category import Category, CategoryRead
+from app.models.tag import ArticleTagLink, Tag, TagRead
+
+ARTICLE_COLUMNS = (
+    "id",
+    "title",
+    "content",
+    "excerpt",
+    "published_at",
+    "author_id",
+    "category_id",
+)
+ARTICLE_RELATIONS = ("author", "category", "tags")
+ARTICLE_FIELDS = ARTICLE_COLUMNS + ARTICLE_RELATIONS
+# What `GET /articles` has always returned.
+FULL_FIELDS = tuple(f for f in ARTICLE_FIELDS if f != "excerpt")
+# Articles nested in an author or tag, as ArticleRead.
+READ_FIELDS = ("id", "title", "content", "published_at", "author_id", "category_id")
+# List cards: the stored excerpt instead of the content.
+SUMMARY_FIELDS = tuple(f for f in ARTICLE_FIELDS if f != "content")
+_ROW_RELATIONS = (("author", Author, AuthorRead), ("category", Category, CategoryRead))
+
+
+async def list_articles(
+    session: AsyncSession,
+    *,
+    category: str | None = None,
+    tags: str | None = None,
+    search: str | None = None,
+    cursor: str | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    fields: tuple[str, ...] = FULL_FIELDS,
+    author_id: int | None = None,
+    tag_id: int | None = None,
+) -> tuple[list[Article], str | None]:
+    """Returns a page of articles with the chosen `fields` loaded.
+
+    Columns outside `fields` are never read, so a summary page does not
+    transfer article bodies; the other attributes must not be accessed.
+    Articles are ordered newest first by `(published_at, id)`, or by
+    relevance when searching. The second value is the cursor of the next
+    page, or None when this page is not full.
+    """
+    base = select(Article).join(Author).join(Category).options(*_load_options(fields))
+    query, score = _page_query(
+        base, category, tags, search, cursor, offset, limit, author_id, tag_id
+    )
+    next_cursor = None
+    if score is None:
+        articles = list((await session.exec(query)).all())
+        if _continues_into_null_tail(cursor, len(articles), limit):
+            query = _null_tail_query(
+                base, category, tags, limit - len(articles), author_id, tag_id
+            )
+            articles += (await session.exec(query)).all()
+        if articles and len(articles) == limit:
+            last = articles[-1]
+            next_cursor = encode_cursor(last.published_at, last.id)
+    else:
+        rows = (await session.execute(query)).all()
+        articles = [article for article, _ in rows]
+        if rows and len(rows) == limit:
+            last, last_score = rows[-1]
+            next_cursor = encode_cursor(last_score, last.id)
+    return list(articles), next_cursor
+
+
+async def list_article_rows(
+    session: AsyncSession,
+    *,
+    category: str | None = None,
+    tags: str | None = None,
+    search: str | None = None,
+    cursor: str | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    fields: tuple[str, ...] = FULL_FIELDS,
+    author_id: int | None = None,
+    tag_id: int | None = None,
+) -> tuple[list[dict], str | None]:
+    """Returns the page `list_articles` would, as plain dicts built from row tuples.
+
+    No ORM objects are constructed and nothing is validated: the dicts hold
+    exactly what ArticleFields would serialize for `fields`, ready for a
+    JSON encoder.
+    """
+    base = select(*_row_columns(fields)).select_from(Article).join(Author)
+    base = base.join(Category)
+    query, score = _page_query(
+        base, category, tags, search, cursor, offset, limit, author_id, tag_id
+    )
+    rows = list((await session.execute(query)).all())
+    if score is None and _continues_into_null_tail(cursor, len(rows), limit):
+        query = _null_tail_query(
+            base, category, tags, limit - len(rows), author_id, tag_id
+        )
+        rows += (await session.execute(query)).all()
+    next_cursor = None
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            last.published_at if score is None else last[-1], last.id
+        )
+    return await _row_dicts(session, rows, fields), next_cursor
+
+
+async def get_article_row(
+    session: AsyncSession, article_id: int, fields: tuple[str, ...] | None = None
+) -> dict | None:
+    """Returns an article's `fields`, by default as ArticleReadWithDetails would
+    serialize it."""
+    fields = fields or tuple(ArticleReadWithDetails.model_fields)
+    query = select(*_row_columns(fields)).select_from(Article).join(Author)
+    query = query.join(Category).where(Article.id == article_id)
+    rows = (await session.execute(query)).all()
+    if not rows:
+        return None
+    return (await _row_dicts(session, rows, fields))[0]
+
+
+def _page_query(
+    query, category, tags, search, cursor, offset, limit, author_id, tag_id
+):
+    """Filters, orders and limits an article query; returns it and the search score."""
+    query = filter_articles(
+        query, category, tags, author_id=author_id, tag_id=tag_id, paged=True
+    )
+    terms = search_terms(search) if search else []
+    score = None
+    if terms:
+        query, score = search_backend.apply(query, terms)
+    if score is None:
+        if cursor:
+            query = _after_published_cursor(query, cursor)
+        query = query.order_by(
+            Article.published_at.desc().nulls_last(), Article.id.desc()
+        )
+    else:
+        if cursor:
+            query = _after_score_cursor(query, score, cursor)
+        query = query.add_columns(score).order_by(score.desc(), Article.id.desc())
+    if not cursor:
+        query = query.offset(offset)
+    return query.limit(limit), score
+
+
+def _null_tail_query(base, category, tags, limit, author_id, tag_id):
+    """The first `limit` articles without published_at, which sort last."""
+    query = filter_articles(
+        base, category, tags, author_id=author_id, tag_id=tag_id, paged=True
+    )
+    query = query.where(Article.published_at.is_(None))
+    return query.order_by(Article.id.desc()).limit(limit)
+
+
+def _row_columns(fields: tuple[str, ...]) -> list:
+    # id and published_at are always selected for tags and the next cursor.
+    columns = [
+        getattr(Article, c)
+        for c in ARTICLE_COLUMNS
+        if c in fields or c in ("id", "published_at")
+    ]
+    for relation, model, read_model in _ROW_RELATIONS:
+        if relation in fields:
+            columns += [
+                getattr(model, name).label(f"{relation}__{name}")
+                for name in read_model.model_fields
+            ]
+    return columns
+
+
+async def _row_dicts(session: AsyncSession, rows, fields: tuple[str, ...]) -> list:
+    tags_by_article: dict[int, list[dict]] = {}
+    if "tags" in fields and rows:
+        tag_fields = tuple(TagRead.model_fields)
+        tag_rows = await session.execute(
+            select(ArticleTagLink.article_id, *(getattr(Tag, f) for f in tag_fields))
+            .join(Tag)
+            .where(ArticleTagLink.article_id.in_([row.id for row in rows]))
+        )
+        for article_id, *values in tag_rows:
+            tags_by_article.setdefault(article_id, []).append(
+                dict(zip(tag_fields, values))
+            )
+    relations = {
+        relation: [(name, f"{relation}__{name}") for name in read_model.model_fields]
+        for relation, _, read_model in _ROW_RELATIONS
+    }
+    items = []
+    for row in rows:
+        values = row._mapping
+        item = {}
+        for field in fields:
+            if field == "tags":
+                item[field] = tags_by_article.get(row.id, [])
+            elif field in relations:
+                item[field] = {name: values[label] for name, label in relations[field]}
+            else:
+                item[field] = values[field]
+        items.append(item)
+    return items
+
+
+async def article_facets(
+    session: AsyncSession,
+    *,
+    category: str | None = None,
+    tags: str | None = None,
+    search: str | None = None,
+) -> ArticleFacets:
+    """Counts the articles matching the filters per category and per tag.
+
+    Each facet ignores its own filter, so the counts show what choosing a
+    different category or adding a tag would match. Both facets come from
+    one UNION ALL of two grouped queries.
+    """
+    terms = search_terms(search) if search else []
+    by_category = (
+        select(
+            literal("category").label("facet"),
+            Category.id,
+            Category.name,
+            func.count(Article.id).label("count"),
+        )
+        .select_from(Article)
+        .join(Category)
+    )
+    by_category = filter_articles(by_category, None, tags)
+    by_tag = (
+        select(
+            literal("tag").label("facet"),
+            Tag.id,
+            Tag.name,
+            func.count(Article.id).label("count"),
+        )
+        .select_from(Article)
+        .join(Category)
+        .join(ArticleTagLink, ArticleTagLink.article_id == Article.id)
+        .join(Tag, Tag.id == ArticleTagLink.tag_id)
+    )
+    by_tag = filter_articles(by_tag, category, None)
+    if terms:
+        by_category, _ = search_backend.apply(by_category, terms)
+        by_tag, _ = search_backend.apply(by_tag, terms)
+    query = union_all(
+        by_category.group_by(Category.id, Category.name),
+        by_tag.group_by(Tag.id, Tag.name),
+    )
+    facets = ArticleFacets()
+    for facet, id, name, count in (await session.execute(query)).all():
+        counts = facets.categories if facet == "category" else facets.tags
+        counts.append(FacetCount(id=id, name=name, count=count))
+    for counts in (facets.categories, facets.tags):
+        counts.sort(key=lambda c: (-c.count, c.name))
+    return facets
+
+
+async def count_articles(
+    session: AsyncSession, *, author_id: int | None = None, tag_id: int | None = None
+) -> int:
+    """Counts an author's or a tag's articles with one aggregate query."""
+    if tag_id is not None:
+        query = select(func.count()).where(ArticleTagLink.tag_id == tag_id)
+    else:
+        query = select(func.count()).where(Article.author_id == author_id)
+    return (await session.exec(query)).one()
+
+
+async def get_article(session: AsyncSession, article_id: int) -> Article | None:
+    return await session.get(
+        Article,
+        article_id,
+        options=[
+            joinedload(Article.author),
+            joinedload(Article.category),
+            selectinload(Article.tags),
+        ],
+    )
+
+
+def parse_fields(fields: str) -> tuple[str, ...]:
+    """Parses a comma-separated `fields=` value into ARTICLE_FIELDS order."""
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = names - set(ARTICLE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}; "
+            f"choose from {', '.join(ARTICLE_FIELDS)}",
+        )
+    return tuple(f for f in ARTICLE_FIELDS if f in names | {"id"})
+
+
+def article_fields(article: Article, fields: tuple[str, ...]) -> dict:
+    """Returns the `fields` of an article loaded by `list_articles`."""
+    return {field: getattr(article, field) for field in fields}
+
+
+def _load_options(fields: tuple[str, ...]) -> list:
+    # The cursor of the next page is built from published_at.
+    columns = {"published_at"} | set(fields)
+    options = [
+        load_only(*(getattr(Article, c) for c in ARTICLE_COLUMNS if c in columns))
+    ]
+    if "author" in fields:
+        options.append(contains_eager(Article.author))
+    if "category" in fields:
+        options.append(contains_eager(Article.category))
+    if "tags" in fields:
+        options.append(selectinload(Article.tags))
+    return options
+
+
+def filter_articles(
+    query,
+    category: str | None,
+    tags: str | None,
+    *,
+    author_id: int | None = None,
+    tag_id: int | None = None,
+    paged: bool = False,
+):
+    """Applies the category, tag and owner filters to a query joined to Category.
+
+    With `paged`, tags are matched per article as the (published_at, id)
+    index is walked, so a page stops at its LIMIT instead of sorting every
+    article with the tag; aggregates look the tag's articles up instead.
+    """
+    if author_id is not None:
+        query = query.where(Article.author_id == author_id)
+    if tag_id is not None:
+        query = query.where(_tagged(ArticleTagLink.tag_id == tag_id, paged))
+    if category:
+        query = query.where(Category.name == category)
+    if tags:
+        tag_names = [tag.strip() for tag in tags.split(",")]
+        tag_ids = select(Tag.id).where(Tag.name.in_(tag_names))
+        query = query.where(_tagged(ArticleTagLink.tag_id.in_(tag_ids), paged))
+    return query
+
+
+def _tagged(condition, paged: bool):
+    if paged:
+        return exists().where(ArticleTagLink.article_id == Article.id, condition)
+    return Article.id.in_(select(ArticleTagLink.article_id).where(condition))
+
+
+def _after_published_cursor(query, cursor: str):
+    last_published, last_id = decode_cursor(cursor, 2)
+    if not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    last_published = parse_cursor_datetime(last_published)
+    if last_published is None:
+        return query.where(and_(Article.published_at.is_(None), Article.id < last_id))
+    # A pure range, so the (published_at, id) index seeks straight to the
+    # cursor; the articles without published_at are read once it runs out.
+    return query.where(
+        tuple_(Article.published_at, Article.id) < (last_published, last_id)
+    )
+
+
+def _continues_into_null_tail(cursor, count: int, limit: int) -> bool:
+    """Whether a short page after a dated cursor goes on into the undated articles."""
+    if not cursor or count >= limit:
+        return False
+    return decode_cursor(cursor, 2)[0] is not None
+
+
+def _after_score_cursor(query, score, cursor: str):
+    last_score, last_id = decode_cursor(cursor, 2)
+    if not isinstance(last_score, (int, float)) or not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return query.where(tuple_(score, Article.id) < (last_score, last_id))
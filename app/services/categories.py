@@ -0,0 +1,11 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models.category import Category
+
+
+async def list_categories(
+    session: AsyncSession, offset: int = 0, limit: int = 50
+) -> list[Category]:
+    return list(
+        (await session.exec(select(Category).offset(offset).limit(limit))).all()
+    )
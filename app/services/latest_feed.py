@@ -0,0 +1,172 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from fastapi import HTTPException
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.pagination import decode_cursor, encode_cursor, parse_cursor_datetime
+from app.core.config import settings
+from app.db.session import session_scope
+from app.models.article import Article
+from app.services.articles import ARTICLE_FIELDS, get_article_row, list_article_rows
+
+FeedPage = tuple[list[dict], str | None]
+
+
+@dataclass
+class FeedStats:
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    size: int = 0
+
+
+def _sort_key(published_at: datetime | None, article_id: int) -> tuple:
+    # Newest first with NULL published_at last, as `list_articles` orders.
+    return (published_at is not None, published_at or datetime.min, article_id)
+
+
+class LatestFeed:
+    """The newest `size` articles, kept in memory for the unfiltered list.
+
+    The head is read with one query on first use, then kept current by the
+    article endpoints: creates and edits patch it in place and deletes drop
+    the article. Writes that touch many articles, or the authors, categories
+    and tags embedded in them, `reset` it instead. It is reloaded after `ttl`
+    seconds so writes handled by other workers show up.
+
+    Items hold every field of ARTICLE_FIELDS as `list_article_rows` builds
+    them. Pages that reach past the head return None and are read from the
+    database by the caller.
+    """
+
+    def __init__(self, size: int, ttl: float):
+        self.size = size
+        self.ttl = ttl
+        self.stats = FeedStats()
+        self._items: list[dict] | None = None
+        self._keys: list[tuple] = []
+        # Whether the head holds every article, so no page reaches past it.
+        self._complete = False
+        self._loaded_at = 0.0
+        # Bumped by every write; a load that raced one is not kept.
+        self._version = 0
+        # Bumped whenever the head is replaced or dropped.
+        self._epoch = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    async def page(
+        self, limit: int, cursor: str | None, fields: tuple[str, ...]
+    ) -> FeedPage | None:
+        """Returns the page after `cursor` from the head, or None if it is not there."""
+        after = self._cursor_key(cursor) if cursor else None
+        items, keys, complete = await self._head()
+        start = 0
+        if after is not None:
+            start = next((i for i, key in enumerate(keys) if key < after), len(items))
+        if start + limit > len(items) and not complete:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        page = [{f: item[f] for f in fields} for item in items[start : start + limit]]
+        next_cursor = None
+        if page and len(page) == limit:
+            last = items[start + limit - 1]
+            next_cursor = encode_cursor(last["published_at"], last["id"])
+        return page, next_cursor
+
+    async def article_saved(self, session: AsyncSession, article: Article) -> None:
+        """Puts a created or edited article into the head if it belongs there.
+
+        Call after the write is committed.
+        """
+        self._version += 1
+        if self._items is None:
+            return
+        key = _sort_key(article.published_at, article.id)
+        present = any(item["id"] == article.id for item in self._items)
+        # Past the last article of an incomplete head, it may not be next.
+        if (
+            not present
+            and not self._complete
+            and (not self._keys or key < self._keys[-1])
+        ):
+            return
+        epoch = self._epoch
+        row = await get_article_row(session, article.id, ARTICLE_FIELDS)
+        if epoch != self._epoch:
+            # Reset, or loaded after the commit, so already up to date.
+            return
+        self._remove(article.id)
+        if row is not None:
+            self._insert(row)
+
+    def article_deleted(self, article_id: int) -> None:
+        self._version += 1
+        if self._items is not None:
+            self._remove(article_id)
+
+    def reset(self) -> None:
+        """Drops the head; the next read loads it again."""
+        self._items = None
+        self._keys = []
+        self._version += 1
+        self._epoch += 1
+
+    async def _head(self) -> tuple[list[dict], list[tuple], bool]:
+        if self._fresh():
+            return self._items, self._keys, self._complete
+        async with self._lock:
+            if self._fresh():
+                return self._items, self._keys, self._complete
+            version = self._version
+            # From the primary: a lagging replica would fill the head with
+            # rows that the next in-place update assumes are current.
+            async with session_scope() as session:
+                items, next_cursor = await list_article_rows(
+                    session, limit=self.size, fields=ARTICLE_FIELDS
+                )
+            self.stats.loads += 1
+            keys = [_sort_key(item["published_at"], item["id"]) for item in items]
+            complete = next_cursor is None
+            if version == self._version:
+                self._items, self._keys, self._complete = items, keys, complete
+                self._loaded_at = time.monotonic()
+                self._epoch += 1
+                self.stats.size = len(items)
+            return items, keys, complete
+
+    def _fresh(self) -> bool:
+        return self._items is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    def _cursor_key(self, cursor: str) -> tuple:
+        last_published, last_id = decode_cursor(cursor, 2)
+        if not isinstance(last_id, int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return _sort_key(parse_cursor_datetime(last_published), last_id)
+
+    def _insert(self, row: dict) -> None:
+        key = _sort_key(row["published_at"], row["id"])
+        index = next((i for i, k in enumerate(self._keys) if k < key), len(self._keys))
+        self._items.insert(index, row)
+        self._keys.insert(index, key)
+        if len(self._items) > self.size:
+            self._items.pop()
+            self._keys.pop()
+            self._complete = False
+        self.stats.size = len(self._items)
+
+    def _remove(self, article_id: int) -> None:
+        for index, item in enumerate(self._items):
+            if item["id"] == article_id:
+                del self._items[index]
+                del self._keys[index]
+                self.stats.size = len(self._items)
+                return
+
+
+latest_feed = LatestFeed(settings.LATEST_FEED_SIZE, settings.LATEST_FEED_TTL_SECONDS)
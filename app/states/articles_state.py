@@ -1,60 +1,228 @@
+import asyncio
+import time
 import reflex as rx
-import httpx
-from app.models.article import ArticleReadWithDetails
+from app.db.session import session_scope
+from app.models.article import ArticleSummary
 from app.models.category import CategoryRead
+from app.db.search import search_terms
+from app.services.articles import SUMMARY_FIELDS, article_facets, list_articles
+from app.services.categories import list_categories
+from app.services.latest_feed import latest_feed
 import logging
 
+# Categories rarely change, so search and filter changes only refetch articles.
+CATEGORIES_TTL_SECONDS = 300
+# Articles fetched per cursor page; the first page alone gates the first card.
+PAGE_SIZE = 20
+# Cards kept on the page; older ones are dropped from the top past this.
+MAX_RENDERED_ARTICLES = 200
+# The running fetch of each client, cancelled when a newer one starts.
+_inflight_fetches: dict[str, asyncio.Task] = {}
+# The next page of each client, fetched ahead of its scroll position and
+# keyed by client token to (generation, cursor, task).
+_prefetches: dict[str, tuple[int, str, asyncio.Task]] = {}
+MAX_PREFETCHES = 1000
+
+ArticlesPage = tuple[list[ArticleSummary], str | None]
+
+
+async def load_articles(
+    search: str, category: str, cursor: str | None = None
+) -> ArticlesPage:
+    if latest_feed.enabled and not (search or category):
+        feed_page = await latest_feed.page(PAGE_SIZE, cursor, SUMMARY_FIELDS)
+        if feed_page is not None:
+            items, next_cursor = feed_page
+            return [ArticleSummary.model_validate(a) for a in items], next_cursor
+    async with session_scope(read_only=True) as session:
+        articles, next_cursor = await list_articles(
+            session,
+            search=search or None,
+            category=category or None,
+            cursor=cursor,
+            limit=PAGE_SIZE,
+            fields=SUMMARY_FIELDS,
+        )
+        return [ArticleSummary.model_validate(a) for a in articles], next_cursor
+
+
+async def load_category_counts(search: str) -> dict[str, int]:
+    async with session_scope(read_only=True) as session:
+        facets = await article_facets(session, search=search or None)
+        return {c.name: c.count for c in facets.categories}
+
+
+async def load_categories() -> list[CategoryRead]:
+    async with session_scope(read_only=True) as session:
+        categories = await list_categories(session)
+        return [CategoryRead.model_validate(c) for c in categories]
+
+
+def _cancel_prefetch(client: str) -> None:
+    pending = _prefetches.pop(client, None)
+    if pending is not None:
+        pending[2].cancel()
+
+
+def _start_prefetch(
+    client: str, generation: int, cursor: str | None, search: str, category: str
+) -> None:
+    _cancel_prefetch(client)
+    if not cursor:
+        return
+    task = asyncio.create_task(load_articles(search, category, cursor))
+    # Retrieve the error of a prefetch nobody awaits, so it is not logged
+    # as never retrieved; load_more refetches and reports it instead.
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    _prefetches[client] = (generation, cursor, task)
+    while len(_prefetches) > MAX_PREFETCHES:
+        _cancel_prefetch(next(iter(_prefetches)))
+
+
+def _take_prefetch(
+    client: str, generation: int, cursor: str, search: str, category: str
+) -> asyncio.Task:
+    """Returns the prefetched page at `cursor`, or starts fetching it now."""
+    pending = _prefetches.pop(client, None)
+    if pending is not None:
+        task = pending[2]
+        failed = task.done() and (task.cancelled() or task.exception() is not None)
+        if pending[:2] == (generation, cursor) and not failed:
+            return task
+        task.cancel()
+    return asyncio.create_task(load_articles(search, category, cursor))
+
 
 class ArticlesState(rx.State):
     """State to manage fetching and filtering articles."""
 
-    articles: list[ArticleReadWithDetails] = []
+    articles: list[ArticleSummary] = []
     categories: list[CategoryRead] = []
+    # Matching articles per category name for the current search.
+    category_counts: dict[str, int] = {}
     is_loading: bool = True
+    is_loading_more: bool = False
+    has_more: bool = False
+    # Cards dropped from the top to keep the window at MAX_RENDERED_ARTICLES.
+    hidden_count: int = 0
     search_query: str = ""
     selected_category: str = ""
+    _categories_loaded_at: float = 0.0
+    _fetch_generation: int = 0
+    _next_cursor: str = ""
+    # Search terms category_counts was computed for; None before the first load.
+    _counts_terms: list[str] | None = None
 
     @rx.event(background=True)
     async def fetch_articles_and_categories(self):
-        """Fetch articles and categories from the FastAPI backend."""
+        """Load the first page of articles, categories when stale and counts.
+
+        The state runs in the same process as the API, so it queries the
+        database directly instead of calling the API over loopback HTTP.
+
+        Each fetch takes a new generation number and cancels the client's
+        previous fetch; results from a superseded generation are dropped.
+        Once the first page is shown, the next one is prefetched. Category
+        counts ignore the selected category, so they are only reloaded when
+        the search terms change.
+        """
         async with self:
             self.is_loading = True
+            self.is_loading_more = False
+            self._fetch_generation += 1
+            generation = self._fetch_generation
+            client = self.router.session.client_token
+            search, category = self.search_query, self.selected_category
+            categories_stale = (
+                time.time() - self._categories_loaded_at > CATEGORIES_TTL_SECONDS
+            )
+            terms = search_terms(search)
+            counts_stale = self._counts_terms != terms
+        previous = _inflight_fetches.get(client)
+        if previous is not None:
+            previous.cancel()
+        _cancel_prefetch(client)
+        _inflight_fetches[client] = asyncio.current_task()
         try:
-            async with httpx.AsyncClient() as client:
-                params = {}
-                if self.search_query:
-                    params["search"] = self.search_query
-                if self.selected_category:
-                    params["category"] = self.selected_category
-                articles_response = await client.get(
-                    f"http://localhost:8000/api/v1/articles", params=params
-                )
-                articles_response.raise_for_status()
-                articles_data = articles_response.json()
-                categories_response = await client.get(
-                    f"http://localhost:8000/api/v1/categories"
-                )
-                categories_response.raise_for_status()
-                categories_data = categories_response.json()
-                async with self:
-                    self.articles = articles_data
-                    self.categories = categories_data
-        except httpx.HTTPStatusError as e:
-            logging.exception(
-                f"HTTP error fetching data: {e.response.status_code} - {e.response.text}"
+            jobs = {"page": load_articles(search, category)}
+            if categories_stale:
+                jobs["categories"] = load_categories()
+            if counts_stale:
+                jobs["counts"] = load_category_counts(search)
+            results = dict(zip(jobs, await asyncio.gather(*jobs.values())))
+            articles, next_cursor = results["page"]
+            async with self:
+                if generation != self._fetch_generation:
+                    return
+                self.articles = articles
+                self.hidden_count = 0
+                self._set_next_cursor(next_cursor)
+                if "categories" in results:
+                    self.categories = results["categories"]
+                    self._categories_loaded_at = time.time()
+                if "counts" in results:
+                    self.category_counts = results["counts"]
+                    self._counts_terms = terms
+            _start_prefetch(client, generation, next_cursor, search, category)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            logging.exception(f"An unexpected error occurred: {e}")
+        finally:
+            if _inflight_fetches.get(client) is asyncio.current_task():
+                del _inflight_fetches[client]
+            async with self:
+                if generation == self._fetch_generation:
+                    self.is_loading = False
+
+    @rx.event(background=True)
+    async def load_more(self):
+        """Append the next page, taking it from the prefetch when it is ready."""
+        async with self:
+            if self.is_loading or self.is_loading_more or not self.has_more:
+                return
+            self.is_loading_more = True
+            generation = self._fetch_generation
+            client = self.router.session.client_token
+            cursor = self._next_cursor
+            search, category = self.search_query, self.selected_category
+        try:
+            articles, next_cursor = await _take_prefetch(
+                client, generation, cursor, search, category
             )
+            async with self:
+                if generation != self._fetch_generation:
+                    return
+                self._append(articles)
+                self._set_next_cursor(next_cursor)
+            _start_prefetch(client, generation, next_cursor, search, category)
+        except asyncio.CancelledError:
+            return
         except Exception as e:
             logging.exception(f"An unexpected error occurred: {e}")
         finally:
             async with self:
-                self.is_loading = False
+                if generation == self._fetch_generation:
+                    self.is_loading_more = False
+
+    def _append(self, articles: list[ArticleSummary]):
+        window = self.articles + articles
+        overflow = max(0, len(window) - MAX_RENDERED_ARTICLES)
+        self.articles = window[overflow:]
+        self.hidden_count += overflow
+
+    def _set_next_cursor(self, cursor: str | None):
+        self._next_cursor = cursor or ""
+        self.has_more = cursor is not None
 
     @rx.event
     def set_search_query(self, query: str):
+        unchanged = search_terms(query) == search_terms(self.search_query)
         self.search_query = query
-        return ArticlesState.fetch_articles_and_categories
+        if not unchanged:
+            return ArticlesState.fetch_articles_and_categories
 
     @rx.event
     def set_selected_category(self, category: str):
         self.selected_category = category
-        return ArticlesState.fetch_articles_and_categories
\ No newline at end of file
+        return ArticlesState.fetch_articles_and_categories
@@ -0,0 +1,101 @@
+"""Compares API throughput with DB_ASYNC on and off at high concurrency.
+
+Each mode runs in its own interpreter, because the engine is chosen at
+import time. Requests go through the ASGI app in-process, so sync mode
+is still bounded by the Starlette threadpool exactly as under uvicorn.
+
+    python -m benchmarks.async_throughput --requests 5000 --concurrency 400
+
+Set REFLEX_DB_URL to benchmark against a real database; by default a
+throwaway SQLite file is seeded.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PATHS = ["/api/v1/articles/?limit=20", "/api/v1/articles/1", "/api/v1/categories/"]
+
+
+async def run_load(total: int, concurrency: int) -> dict:
+    import httpx
+    from fastapi import FastAPI
+    from app.api.v1.api import api_router
+    from app.core.config import settings
+    from app.core.cache import response_cache
+    from app.db.init_db import create_db_and_tables, create_initial_data
+
+    create_db_and_tables()
+    create_initial_data()
+    # Measure the database path, not cache hits.
+    response_cache.backend = None
+    api = FastAPI()
+    api.include_router(api_router, prefix=settings.API_V1_STR)
+    transport = httpx.ASGITransport(app=api)
+    latencies: list[float] = []
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(PATHS[i % len(PATHS)])
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while not queue.empty():
+            path = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": total,
+        "seconds": round(elapsed, 3),
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(asyncio.run(run_load(args.requests, args.concurrency))))
+        return
+    results = {}
+    for mode in ("true", "false"):
+        env = dict(os.environ, DB_ASYNC=mode)
+        if "REFLEX_DB_URL" not in os.environ:
+            path = os.path.join(tempfile.mkdtemp(), "bench.db")
+            env["REFLEX_DB_URL"] = f"sqlite:///{path}"
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.async_throughput", "--child"]
+            + ["--requests", str(args.requests)]
+            + ["--concurrency", str(args.concurrency)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results["async" if mode == "true" else "sync"] = json.loads(
+            output.strip().splitlines()[-1]
+        )
+    for mode, result in results.items():
+        print(f"{mode:>5}: {json.dumps(result)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Times POST /articles/bulk for a generated NDJSON archive.
+
+    python -m benchmarks.bulk_import --articles 100000
+
+Set REFLEX_DB_URL to benchmark against a real database; by default a
+throwaway SQLite file is seeded.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+CHUNK_BYTES = 64 * 1024
+
+
+def archive(total: int) -> bytes:
+    lines = (
+        json.dumps(
+            {
+                "title": f"Imported article {i}",
+                "content": f"Body of imported article {i}. " * 20,
+                "author_id": 1,
+                "category_id": 1 + i % 2,
+                "tags": ["imported", f"batch-{i % 100}"],
+            }
+        )
+        for i in range(total)
+    )
+    return "\n".join(lines).encode()
+
+
+async def run(total: int) -> dict:
+    import httpx
+    from fastapi import FastAPI
+    from app.api.v1.api import api_router
+    from app.core.config import settings
+    from app.db.init_db import create_db_and_tables, create_initial_data
+
+    create_db_and_tables()
+    create_initial_data()
+    api = FastAPI()
+    api.include_router(api_router, prefix=settings.API_V1_STR)
+    body = archive(total)
+
+    async def stream():
+        for start in range(0, len(body), CHUNK_BYTES):
+            yield body[start : start + CHUNK_BYTES]
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=api), base_url="http://bench", timeout=None
+    ) as client:
+        login = await client.post(
+            f"{settings.API_V1_STR}/login/access-token",
+            data={"username": "author@aimlblog.com", "password": "AuthorPass123!"},
+        )
+        token = login.json()["access_token"]
+        start = time.perf_counter()
+        response = await client.post(
+            f"{settings.API_V1_STR}/articles/bulk",
+            content=stream(),
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/x-ndjson",
+            },
+        )
+        elapsed = time.perf_counter() - start
+    response.raise_for_status()
+    report = response.json()
+    return {
+        "created": report["created"],
+        "failed": report["failed"],
+        "seconds": round(elapsed, 2),
+        "articles_per_second": round(report["created"] / elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=100_000)
+    args = parser.parse_args()
+    if "REFLEX_DB_URL" not in os.environ:
+        path = os.path.join(tempfile.mkdtemp(), "bench.db")
+        os.environ["REFLEX_DB_URL"] = f"sqlite:///{path}"
+    print(json.dumps(asyncio.run(run(args.articles))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Compares the validated and FAST_JSON paths for 100-item article pages.
+
+Both paths run in one process against the same data: FAST_JSON is read on
+every request, so it is toggled between runs. The response cache and
+compression are bypassed so each request builds and encodes its body.
+
+    python -m benchmarks.json_serialization --iterations 300
+
+Set REFLEX_DB_URL to benchmark against a real database; by default a
+throwaway SQLite file is seeded with `--articles` articles.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+PATHS = {"list": "/api/v1/articles/?limit=100", "detail": "/api/v1/articles/1"}
+
+
+def seed(count: int) -> None:
+    from sqlmodel import Session, select
+    from app.db.init_db import init_db
+    from app.db.session import engine
+    from app.models.article import Article
+    from app.models.tag import Tag
+
+    init_db()
+    with Session(engine) as session:
+        existing = len(session.exec(select(Article.id)).all())
+        if existing >= count:
+            return
+        tags = [Tag(name=f"bench-tag-{i}") for i in range(10)]
+        session.add_all(tags)
+        for i in range(existing, count):
+            session.add(
+                Article(
+                    title=f"Benchmark article {i}",
+                    content="Lorem ipsum dolor sit amet. " * 40,
+                    author_id=1 + i % 2,
+                    category_id=1 + i % 2,
+                    tags=tags[i % 10 : i % 10 + 3],
+                )
+            )
+        session.commit()
+
+
+async def time_path(client, path: str, iterations: int) -> tuple[dict, list[float]]:
+    latencies = []
+    body = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = await client.get(path, headers={"Accept-Encoding": "identity"})
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+        body = response.json()
+    return body, latencies
+
+
+def encode_only(iterations: int) -> dict:
+    """Times building and encoding a page from already-fetched data."""
+    import orjson
+    from pydantic import TypeAdapter
+    from app.db.session import session_scope
+    from app.models.article import ArticleFields
+    from app.services.articles import (
+        FULL_FIELDS,
+        article_fields,
+        list_article_rows,
+        list_articles,
+    )
+
+    async def fetch():
+        async with session_scope() as session:
+            articles, _ = await list_articles(session, limit=100)
+            rows, _ = await list_article_rows(session, limit=100)
+            return articles, rows
+
+    articles, rows = asyncio.run(fetch())
+    adapter = TypeAdapter(list[ArticleFields])
+    results = {}
+    start = time.perf_counter()
+    for _ in range(iterations):
+        items = [
+            ArticleFields.model_validate(
+                article_fields(article, FULL_FIELDS), from_attributes=True
+            )
+            for article in articles
+        ]
+        adapter.dump_json(adapter.validate_python(items), exclude_unset=True)
+    results["validated_ms"] = (time.perf_counter() - start) / iterations * 1000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        orjson.dumps(rows)
+    results["fast_ms"] = (time.perf_counter() - start) / iterations * 1000
+    return {k: round(v, 3) for k, v in results.items()}
+
+
+async def run(iterations: int) -> None:
+    import httpx
+    from app.api_app import create_api_app
+    from app.core.cache import response_cache
+    from app.core.config import settings
+
+    response_cache.backend = None
+    transport = httpx.ASGITransport(app=create_api_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        for name, path in PATHS.items():
+            bodies = {}
+            for fast in (False, True):
+                settings.FAST_JSON = fast
+                await time_path(c, path, 10)
+                bodies[fast], latencies = await time_path(c, path, iterations)
+                label = "fast" if fast else "validated"
+                print(
+                    f"{name:>6} {label:>9}: "
+                    f"mean {statistics.mean(latencies) * 1000:.2f} ms, "
+                    f"p50 {statistics.median(latencies) * 1000:.2f} ms"
+                )
+            print(f"{name:>6} identical bodies: {bodies[False] == bodies[True]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--articles", type=int, default=1000)
+    args = parser.parse_args()
+    if "REFLEX_DB_URL" not in os.environ:
+        path = os.path.join(tempfile.mkdtemp(), "bench.db")
+        os.environ["REFLEX_DB_URL"] = f"sqlite:///{path}"
+    seed(args.articles)
+    asyncio.run(run(args.iterations))
+    print(f"encode only: {json.dumps(encode_only(args.iterations))}")
+
+
+if __name__ == "__main__":
+    main()
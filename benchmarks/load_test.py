@@ -0,0 +1,326 @@
+"""Load test of the API with a realistic traffic mix, checked against a baseline.
+
+Seeds a synthetic corpus (see `benchmarks.synthetic`), then `--concurrency`
+clients send list, latest, search, tag-filter, detail, facet and write
+requests in the `--mix` proportions for `--seconds`, after a warm-up whose
+requests are not counted. Latency percentiles and throughput are reported
+per operation and overall.
+
+    python -m benchmarks.load_test --articles 100000 --seconds 30 \\
+        --save-baseline benchmarks/baseline.json
+    python -m benchmarks.load_test --articles 100000 --seconds 30 \\
+        --baseline benchmarks/baseline.json
+
+With `--baseline`, the run exits with status 1 when an operation's p50,
+p95 or p99 exceeds the baseline by more than `--tolerance` (and by at
+least `--min-delta-ms`), when its error rate grows, or when overall
+throughput drops by more than `--tolerance`. Baselines only compare runs
+on the same machine, corpus and options.
+
+Requests go through the full ASGI app in-process, so the clients share
+the event loop and CPU with the server; pass `--base-url` to load a
+server started separately (e.g. under uvicorn) instead, after seeding
+the database it uses.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from benchmarks.synthetic import (
+    VOCABULARY,
+    Corpus,
+    add_arguments,
+    corpus_from_args,
+    seed_corpus,
+    tag_name,
+    use_scratch_database,
+)
+
+API = "/api/v1"
+DEFAULT_MIX = {
+    "list": 30,
+    "latest": 10,
+    "search": 10,
+    "tag_filter": 15,
+    "detail": 25,
+    "facets": 5,
+    "write": 5,
+}
+# Share of detail requests for the newest articles, the rest being uniform.
+HOT_DETAIL_SHARE = 0.8
+HOT_ARTICLES = 1000
+ADMIN_EMAIL = os.getenv("BENCH_EMAIL", "admin@aimlblog.com")
+ADMIN_PASSWORD = os.getenv("BENCH_PASSWORD", "AdminPass123!")
+
+
+class Traffic:
+    """Builds the requests of each operation from what the corpus holds."""
+
+    def __init__(self, max_id: int, categories: list[str], corpus: Corpus, token: str):
+        self.max_id = max_id
+        self.categories = categories
+        # Tags are requested as often as they are used.
+        self.tag_weights = [
+            1 / (rank + 1) ** corpus.tag_skew for rank in range(corpus.tags)
+        ]
+        self.headers = {"Authorization": f"Bearer {token}"}
+
+    def request(self, operation: str, rng: random.Random) -> tuple[str, str, dict]:
+        summary = {"limit": 20, "view": "summary"}
+        if operation == "list":
+            params = dict(summary)
+            if rng.random() < 0.3:
+                params["category"] = rng.choice(self.categories)
+            return "GET", f"{API}/articles/", {"params": params}
+        if operation == "latest":
+            return "GET", f"{API}/articles/latest", {"params": summary}
+        if operation == "search":
+            terms = " ".join(rng.sample(VOCABULARY, 2))
+            return "GET", f"{API}/articles/", {"params": {**summary, "search": terms}}
+        if operation == "tag_filter":
+            params = {**summary, "tags": self._tag(rng)}
+            return "GET", f"{API}/articles/", {"params": params}
+        if operation == "detail":
+            return "GET", f"{API}/articles/{self._article_id(rng)}", {}
+        if operation == "facets":
+            params = {"tags": self._tag(rng)} if rng.random() < 0.5 else {}
+            return "GET", f"{API}/articles/facets", {"params": params}
+        if operation == "write":
+            if rng.random() < 0.6:
+                body = {
+                    "title": " ".join(rng.choices(VOCABULARY, k=5)),
+                    "content": " ".join(rng.choices(VOCABULARY, k=80)),
+                    "author_id": 1,
+                    "category_id": 1,
+                }
+                return (
+                    "POST",
+                    f"{API}/articles/",
+                    {"json": body, "headers": self.headers},
+                )
+            body = {"title": " ".join(rng.choices(VOCABULARY, k=5))}
+            path = f"{API}/articles/{self._article_id(rng)}"
+            return "PATCH", path, {"json": body, "headers": self.headers}
+        raise ValueError(f"Unknown operation {operation!r}")
+
+    def _tag(self, rng: random.Random) -> str:
+        rank = rng.choices(range(len(self.tag_weights)), self.tag_weights)[0]
+        return tag_name(rank)
+
+    def _article_id(self, rng: random.Random) -> int:
+        if rng.random() < HOT_DETAIL_SHARE:
+            return max(1, self.max_id - rng.randrange(HOT_ARTICLES))
+        return rng.randint(1, self.max_id)
+
+
+def percentile(latencies: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted `latencies`, in milliseconds."""
+    index = min(len(latencies) - 1, max(0, math.ceil(q * len(latencies)) - 1))
+    return round(latencies[index] * 1000, 2)
+
+
+def summarize(latencies: list[float], errors: int, seconds: float) -> dict:
+    latencies = sorted(latencies)
+    count = len(latencies)
+    if not count:
+        return {"requests": 0, "errors": errors}
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4),
+        "rps": round(count / seconds, 1),
+        "mean_ms": round(sum(latencies) / count * 1000, 2),
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+async def load(client, traffic: Traffic, mix: dict, args) -> dict:
+    operations, weights = list(mix), list(mix.values())
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    warm_until = time.perf_counter() + args.warmup
+    stop_at = warm_until + args.seconds
+
+    async def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        while (now := time.perf_counter()) < stop_at:
+            operation = rng.choices(operations, weights)[0]
+            method, path, kwargs = traffic.request(operation, rng)
+            try:
+                response = await client.request(method, path, **kwargs)
+                ok = response.status_code < 400
+            except Exception:
+                ok = False
+            if now < warm_until:
+                continue
+            latencies[operation].append(time.perf_counter() - now)
+            if not ok:
+                errors[operation] += 1
+
+    await asyncio.gather(*(worker(args.seed + i) for i in range(args.concurrency)))
+    return {
+        "operations": {
+            operation: summarize(latencies[operation], errors[operation], args.seconds)
+            for operation in operations
+        },
+        "overall": summarize(
+            [value for values in latencies.values() for value in values],
+            sum(errors.values()),
+            args.seconds,
+        ),
+    }
+
+
+async def prepare(client, corpus: Corpus) -> Traffic:
+    response = await client.post(
+        f"{API}/login/access-token",
+        data={"username": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+    )
+    response.raise_for_status()
+    token = response.json()["access_token"]
+    newest = await client.get(f"{API}/articles/", params={"limit": 1, "fields": "id"})
+    newest.raise_for_status()
+    categories = await client.get(f"{API}/categories/")
+    categories.raise_for_status()
+    return Traffic(
+        max_id=newest.json()[0]["id"],
+        categories=[category["name"] for category in categories.json()],
+        corpus=corpus,
+        token=token,
+    )
+
+
+async def run(args, corpus: Corpus) -> dict:
+    import httpx
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as client:
+            traffic = await prepare(client, corpus)
+            return await load(client, traffic, args.mix, args)
+    from app.api_app import create_api_app
+    from app.core.cache import response_cache
+
+    if args.no_cache:
+        response_cache.backend = None
+    api = create_api_app()
+    async with api.router.lifespan_context(api):
+        transport = httpx.ASGITransport(app=api)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=30
+        ) as client:
+            traffic = await prepare(client, corpus)
+            return await load(client, traffic, args.mix, args)
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_ms: float):
+    """Lists the ways `results` are worse than `baseline` beyond the tolerance."""
+    regressions = []
+    for operation, current in results["operations"].items():
+        base = baseline["operations"].get(operation)
+        if not base or not base.get("requests") or not current.get("requests"):
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            limit = max(base[metric] * (1 + tolerance), base[metric] + min_delta_ms)
+            if current[metric] > limit:
+                regressions.append(
+                    f"{operation} {metric} {current[metric]} > {limit:.2f} "
+                    f"(baseline {base[metric]})"
+                )
+        if current["error_rate"] > base["error_rate"] + 0.01:
+            regressions.append(
+                f"{operation} error rate {current['error_rate']} "
+                f"(baseline {base['error_rate']})"
+            )
+    base_rps = baseline["overall"].get("rps", 0)
+    if results["overall"].get("rps", 0) < base_rps * (1 - tolerance):
+        regressions.append(
+            f"throughput {results['overall']['rps']} rps "
+            f"< {base_rps * (1 - tolerance):.1f} (baseline {base_rps})"
+        )
+    return regressions
+
+
+def parse_mix(value: str) -> dict:
+    mix = {}
+    for part in value.split(","):
+        operation, _, weight = part.partition("=")
+        if operation.strip() not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown operation {operation!r}")
+        mix[operation.strip()] = float(weight)
+    return mix
+
+
+def print_report(results: dict) -> None:
+    columns = ("requests", "errors", "rps", "mean_ms", "p50_ms", "p95_ms", "p99_ms")
+    print(f"{'operation':>10} " + " ".join(f"{c:>9}" for c in columns))
+    rows = {**results["operations"], "overall": results["overall"]}
+    for operation, stats in rows.items():
+        values = " ".join(f"{stats.get(c, '-'):>9}" for c in columns)
+        print(f"{operation:>10} {values}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    add_arguments(parser, 100000)
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--warmup", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Operation weights, e.g. list=50,detail=50 "
+        f"(default {','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())})",
+    )
+    parser.add_argument("--seed", type=int, default=25)
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the cache")
+    parser.add_argument("--base-url", help="Load a running server instead")
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Fail on regressions against this file")
+    parser.add_argument("--save-baseline", help="Store the results as a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    use_scratch_database("load")
+    corpus = corpus_from_args(args)
+    seed_corpus(corpus)
+    results = asyncio.run(run(args, corpus))
+    results["options"] = {
+        "articles": args.articles,
+        "tags": args.tags,
+        "tag_skew": args.tag_skew,
+        "concurrency": args.concurrency,
+        "mix": args.mix,
+        "cache": not args.no_cache,
+    }
+    print_report(results)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2)
+    if not args.baseline:
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("options") != results["options"]:
+        print(f"warning: baseline options differ: {baseline.get('options')}")
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print("no regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
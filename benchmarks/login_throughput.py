@@ -0,0 +1,107 @@
+"""Measures login throughput and what a login burst does to other endpoints.
+
+A probe requests GET /categories/ one at a time, first on an idle server
+and then while `--concurrency` clients log in continuously. With
+`--inline` the hash runs on the event loop instead of the hashing pool,
+which shows the latency the pool keeps away from other requests.
+
+    python -m benchmarks.login_throughput --seconds 10 --concurrency 50
+
+Set REFLEX_DB_URL to benchmark against a real database; by default a
+throwaway SQLite file is seeded.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+PROBE_PATH = "/api/v1/categories/"
+
+
+def percentiles(latencies: list[float]) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 2),
+    }
+
+
+async def probe(client, until: float) -> list[float]:
+    latencies = []
+    while time.perf_counter() < until:
+        start = time.perf_counter()
+        response = await client.get(PROBE_PATH)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run(seconds: float, concurrency: int, inline: bool) -> dict:
+    import httpx
+    from fastapi import FastAPI
+    from app.api.v1.api import api_router
+    from app.core.cache import response_cache
+    from app.core.config import settings
+    from app.core.security import password_hash_pool
+    from app.db.init_db import create_db_and_tables, create_initial_data
+
+    create_db_and_tables()
+    create_initial_data()
+    response_cache.backend = None
+    if inline:
+
+        async def run_inline(fn, *args):
+            return fn(*args)
+
+        password_hash_pool.run = run_inline
+    api = FastAPI()
+    api.include_router(api_router, prefix=settings.API_V1_STR)
+    statuses: dict[int, int] = {}
+
+    async def login_loop(client, until: float) -> None:
+        while time.perf_counter() < until:
+            response = await client.post(
+                f"{settings.API_V1_STR}/login/access-token",
+                data={"username": "reader@aimlblog.com", "password": "ReaderPass123!"},
+            )
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 503:
+                await asyncio.sleep(0.01)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=api), base_url="http://bench"
+    ) as client:
+        idle = await probe(client, time.perf_counter() + min(seconds, 2))
+        until = time.perf_counter() + seconds
+        *_, loaded = await asyncio.gather(
+            *(login_loop(client, until) for _ in range(concurrency)),
+            probe(client, until),
+        )
+    return {
+        "mode": "inline" if inline else "pool",
+        "logins_per_second": round(statuses.get(200, 0) / seconds, 1),
+        "login_statuses": statuses,
+        "probe_idle": percentiles(idle),
+        "probe_under_login_load": percentiles(loaded),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--inline", action="store_true")
+    args = parser.parse_args()
+    if "REFLEX_DB_URL" not in os.environ:
+        path = os.path.join(tempfile.mkdtemp(), "bench.db")
+        os.environ["REFLEX_DB_URL"] = f"sqlite:///{path}"
+    result = asyncio.run(run(args.seconds, args.concurrency, args.inline))
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Fails if an article endpoint issues more queries than it should.
+
+Seeds a small synthetic corpus, requests each endpoint below once with the
+response cache, the latest feed and request coalescing turned off, and
+counts the statements sent to the database. Any count other than the
+expected one, e.g. a lazy load per article, exits with status 1:
+
+    python -m benchmarks.query_counts
+
+Both response paths are checked, with FAST_JSON off and, when orjson is
+installed, on. Set REFLEX_DB_URL to check a real database; by default a
+throwaway SQLite file is used.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from benchmarks.synthetic import Corpus, seed_corpus, tag_name, use_scratch_database
+
+API = "/api/v1"
+# Path template, query parameters and the queries the request may issue.
+EXPECTED = {
+    "article list": ("/articles/", {"limit": 50}, 2),
+    "article detail": ("/articles/{article}", {}, 2),
+    "author detail": ("/authors/{author}", {"articles_limit": 50}, 3),
+    "tag detail": ("/tags/{tag}", {"articles_limit": 50}, 3),
+    "tag list": ("/tags/", {}, 1),
+}
+
+
+async def count_queries() -> list[tuple[str, bool, int, int]]:
+    """Requests every checked path; returns (name, fast_json, queries, expected)."""
+    import httpx
+    from sqlalchemy import event
+    from app.api_app import create_api_app
+    from app.api.fast_json import orjson
+    from app.core.cache import response_cache
+    from app.core.config import settings
+    from app.db.session import async_engine, engine
+    from app.services.latest_feed import latest_feed
+
+    response_cache.backend = None
+    latest_feed.size = 0
+    settings.COALESCE_REQUESTS = False
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    binds = [engine] + ([async_engine.sync_engine] if async_engine else [])
+    results = []
+    api = create_api_app()
+    async with api.router.lifespan_context(api):
+        transport = httpx.ASGITransport(app=api)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            ids = await _ids(client)
+            for bind in binds:
+                event.listen(bind, "before_cursor_execute", record)
+            try:
+                for fast_json in (False, True) if orjson else (False,):
+                    settings.FAST_JSON = fast_json
+                    for name, (path, params, expected) in EXPECTED.items():
+                        statements.clear()
+                        response = await client.get(
+                            API + path.format(**ids), params=params
+                        )
+                        response.raise_for_status()
+                        results.append((name, fast_json, len(statements), expected))
+            finally:
+                for bind in binds:
+                    event.remove(bind, "before_cursor_execute", record)
+    return results
+
+
+async def _ids(client) -> dict[str, int]:
+    # An article, and an author and tag that have several articles.
+    articles = await client.get(f"{API}/articles/", params={"limit": 1})
+    articles.raise_for_status()
+    article = articles.json()[0]
+    tags = await client.get(f"{API}/tags/", params={"limit": 100})
+    tags.raise_for_status()
+    tag = next(t for t in tags.json() if t["name"] == tag_name(0))
+    return {"article": article["id"], "author": article["author_id"], "tag": tag["id"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=500)
+    args = parser.parse_args()
+    use_scratch_database("queries")
+    seed_corpus(Corpus(articles=args.articles, tags=20, authors=5, categories=5))
+    failures = 0
+    for name, fast_json, queries, expected in asyncio.run(count_queries()):
+        status = "ok" if queries == expected else "FAIL"
+        failures += queries != expected
+        path = "fast json" if fast_json else "models"
+        print(f"[{status}] {name} ({path}): {queries} queries, expected {expected}")
+    print(json.dumps({"failures": failures}))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Fails if a hot article query falls back to a sequential scan.
+
+Seeds a large synthetic corpus, runs the article list, tag filter,
+author detail and tag detail queries through the service layer, and
+EXPLAINs every statement they issue. The tag paths run for a popular and
+a rare tag, and the list and tag paths also from a cursor deep in the
+corpus. A full scan of `article` or `articletaglink`, a walk of an
+article index that does not seek to the cursor, or a page that sorts its
+articles instead of reading them in index order exits with status 1, so
+the script can gate CI:
+
+    python -m benchmarks.query_plans --articles 50000
+
+Set REFLEX_DB_URL to check a real database (the seed is skipped when it
+already holds enough articles); by default a throwaway SQLite file is
+used. Statements run on the sync engine so they can be EXPLAINed with
+the same driver and parameters.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+from functools import partial
+from benchmarks.synthetic import Corpus, seed_corpus, tag_name, use_scratch_database
+
+WATCHED_TABLES = {"article", "articletaglink"}
+# The keyset predicate of a cursor page, which the index must seek to.
+CURSOR_PREDICATE = "(article.published_at, article.id) <"
+# The order of a page, which the index must provide without a sort.
+PAGE_ORDER = "ORDER BY article.published_at DESC"
+# Popularity ranks of the checked tags: on about half the articles, and on few.
+CHECKED_TAGS = {"popular tag": 0, "rare tag": 7}
+# How far into the corpus the deep cursor pages start.
+DEEP_CURSOR_FRACTION = 0.9
+
+
+async def capture_statements() -> dict[str, list[tuple[str, object]]]:
+    """Runs each checked query path and records the statements it issues."""
+    from sqlalchemy import event, func
+    from sqlmodel import select
+    from app.api.pagination import encode_cursor
+    from app.db.session import engine, session_scope
+    from app.models.article import Article
+    from app.models.tag import Tag
+    from app.services.articles import list_articles
+
+    captured: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    checks = {}
+    async with session_scope() as session:
+        tags = {
+            label: (
+                await session.exec(select(Tag).where(Tag.name == tag_name(rank)))
+            ).one()
+            for label, rank in CHECKED_TAGS.items()
+        }
+        total = (await session.exec(select(func.count(Article.id)))).one()
+        deep = (
+            await session.exec(
+                select(Article.published_at, Article.id)
+                .order_by(Article.published_at.desc(), Article.id.desc())
+                .offset(int(total * DEEP_CURSOR_FRACTION))
+                .limit(1)
+            )
+        ).one()
+        cursor = encode_cursor(*deep)
+        paths = {
+            "article list": lambda: list_articles(session, limit=20),
+            "article list, deep cursor": lambda: list_articles(
+                session, cursor=cursor, limit=20
+            ),
+            "author detail": lambda: _detail(session, author_id=2),
+        }
+        for label, tag in tags.items():
+            filtered = partial(list_articles, session, tags=tag.name, limit=20)
+            paths[f"tag filter, {label}"] = filtered
+            paths[f"tag filter, {label}, deep cursor"] = partial(
+                filtered, cursor=cursor
+            )
+            paths[f"tag detail, {label}"] = partial(_detail, session, tag_id=tag.id)
+            paths[f"tag detail, {label}, deep cursor"] = partial(
+                _detail, session, tag_id=tag.id, cursor=cursor
+            )
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            for name, path in paths.items():
+                captured.clear()
+                await path()
+                checks[name] = list(captured)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+    return checks
+
+
+async def _detail(session, cursor=None, **owner):
+    from app.services.articles import READ_FIELDS, count_articles, list_articles
+
+    await list_articles(session, cursor=cursor, limit=20, fields=READ_FIELDS, **owner)
+    await count_articles(session, **owner)
+
+
+def sequential_scans(statement: str, parameters) -> tuple[list[str], list[str]]:
+    """EXPLAINs a statement; returns its plan lines and the scanned or sorted tables."""
+    from app.db.session import engine
+
+    cursor_page = CURSOR_PREDICATE in statement
+    page = PAGE_ORDER in statement
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            plan = connection.exec_driver_sql(
+                "EXPLAIN (FORMAT JSON) " + statement, parameters
+            ).scalar()
+            nodes = list(_plan_nodes(plan[0]["Plan"]))
+            lines = [
+                f"{n['Node Type']} {n.get('Relation Name', '')}".strip() for n in nodes
+            ]
+            scans = [
+                n["Relation Name"]
+                for n in nodes
+                if n.get("Relation Name") in WATCHED_TABLES
+                and (
+                    n["Node Type"] == "Seq Scan"
+                    or cursor_page
+                    and n["Relation Name"] == "article"
+                    and "Index Scan" in n["Node Type"]
+                    and "Index Cond" not in n
+                )
+            ]
+            if page:
+                scans += ["article (sort)" for n in nodes if "Sort" in n["Node Type"]]
+            return lines, scans
+        rows = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters
+        ).all()
+    lines = [row[-1] for row in rows]
+    scans = []
+    for line in lines:
+        if page and line.startswith("USE TEMP B-TREE FOR") and "ORDER BY" in line:
+            scans.append("article (sort)")
+        match = re.match(r"SCAN (\w+)( USING (COVERING )?INDEX)?", line)
+        if match and match.group(1) in WATCHED_TABLES:
+            # An index walk of article is an ordered read cut off by LIMIT,
+            # unless it starts from the top to find a cursor deep down; any
+            # full pass over articletaglink means no seek by tag_id.
+            if not match.group(2) or match.group(1) == "articletaglink" or cursor_page:
+                scans.append(match.group(1))
+    return lines, scans
+
+
+def _plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=50000)
+    args = parser.parse_args()
+    os.environ["DB_ASYNC"] = "false"
+    use_scratch_database("plans")
+    seed_corpus(Corpus(articles=args.articles, tags=200, authors=20, categories=10))
+    failures = 0
+    for name, statements in asyncio.run(capture_statements()).items():
+        for statement, parameters in statements:
+            lines, scans = sequential_scans(statement, parameters)
+            status = "FAIL" if scans else "ok"
+            failures += bool(scans)
+            print(f"[{status}] {name}: {' '.join(statement.split())[:100]}")
+            for line in lines:
+                print(f"         {line}")
+    print(json.dumps({"failures": failures}))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
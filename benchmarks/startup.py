@@ -0,0 +1,82 @@
+"""Compares cold start of the API-only entry point with the full Reflex app.
+
+Every sample is a fresh interpreter that imports the entry point, runs its
+startup handlers and serves one request, timing each step.
+
+    python -m benchmarks.startup --runs 5
+
+Set REFLEX_DB_URL to benchmark against a real database; by default a
+throwaway SQLite file is used, initialized by a first unmeasured start.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ENTRY_POINTS = {
+    "api": "from app.api_app import create_api_app; api = create_api_app()",
+    "full": "from app.app import fastapi_app as api",
+}
+CHILD = """
+import asyncio, json, time
+start = time.perf_counter()
+{entry}
+imported = time.perf_counter()
+
+async def main():
+    import httpx
+    async with api.router.lifespan_context(api):
+        started = time.perf_counter()
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=api), base_url="http://bench"
+        ) as client:
+            response = await client.get("/api/v1/categories/")
+            response.raise_for_status()
+        done = time.perf_counter()
+    print(json.dumps({{
+        "import_ms": (imported - start) * 1000,
+        "startup_ms": (started - imported) * 1000,
+        "first_request_ms": (done - started) * 1000,
+        "total_ms": (done - start) * 1000,
+    }}))
+
+asyncio.run(main())
+"""
+
+
+def sample(entry: str, env: dict) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", CHILD.format(entry=ENTRY_POINTS[entry])],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--entry", choices=ENTRY_POINTS, action="append")
+    args = parser.parse_args()
+    env = dict(os.environ)
+    if "REFLEX_DB_URL" not in env:
+        path = os.path.join(tempfile.mkdtemp(), "bench.db")
+        env["REFLEX_DB_URL"] = f"sqlite:///{path}"
+    sample("api", env)
+    for entry in args.entry or list(ENTRY_POINTS):
+        runs = [sample(entry, env) for _ in range(args.runs)]
+        medians = {
+            key: round(statistics.median(run[key] for run in runs), 1)
+            for key in runs[0]
+        }
+        print(f"{entry:>4}: {json.dumps(medians)}")
+
+
+if __name__ == "__main__":
+    main()
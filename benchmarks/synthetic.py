@@ -0,0 +1,167 @@
+"""Seeds a synthetic corpus sized for load tests and query plan checks.
+
+Tags are chosen with a Zipf distribution, so `tag-0` is on a large share
+of the articles and most tags on a handful, as on a real blog. Titles and
+content draw on a small vocabulary, so every search term matches. Rows go
+in through Core inserts in batches; a run is resumed where it stopped.
+
+    python -m benchmarks.synthetic --articles 1000000 --tags 10000
+
+Set REFLEX_DB_URL to seed a real database; by default a throwaway SQLite
+file is used and its path printed.
+"""
+
+import argparse
+import itertools
+import os
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+VOCABULARY = (
+    "model training data neural network learning vector embedding python "
+    "inference gradient transformer attention dataset pipeline feature "
+    "cluster regression benchmark latency scaling kernel tensor agent "
+    "retrieval evaluation prompt token optimizer checkpoint"
+).split()
+BATCH_SIZE = 10000
+
+
+@dataclass
+class Corpus:
+    articles: int = 100000
+    tags: int = 10000
+    authors: int = 1000
+    categories: int = 50
+    tags_per_article: int = 3
+    # Zipf exponent of tag popularity; 0 spreads articles evenly.
+    tag_skew: float = 1.1
+    seed: int = 25
+
+
+def tag_name(rank: int) -> str:
+    """The name of the tag with popularity rank `rank`, 0 being the most used."""
+    return f"tag-{rank}"
+
+
+def seed_corpus(corpus: Corpus) -> None:
+    """Tops the database up to `corpus` and refreshes planner statistics."""
+    from sqlalchemy import func, insert, text
+    from sqlmodel import Session, select
+    from app.db.init_db import init_db
+    from app.db.session import engine
+    from app.models.article import Article, make_excerpt
+    from app.models.author import Author
+    from app.models.category import Category
+    from app.models.link import ArticleTagLink
+    from app.models.tag import Tag
+
+    init_db()
+    rng = random.Random(corpus.seed)
+    with Session(engine) as session:
+        for model, count, name in (
+            (Author, corpus.authors, "Synthetic author {}"),
+            (Category, corpus.categories, "Synthetic category {}"),
+        ):
+            missing = count - session.exec(select(func.count(model.id))).one()
+            if missing > 0:
+                session.execute(
+                    insert(model), [{"name": name.format(i)} for i in range(missing)]
+                )
+        existing_tags = set(
+            session.exec(select(Tag.name).where(Tag.name.like("tag-%"))).all()
+        )
+        new_tags = [
+            {"name": tag_name(rank)}
+            for rank in range(corpus.tags)
+            if tag_name(rank) not in existing_tags
+        ]
+        for start in range(0, len(new_tags), BATCH_SIZE):
+            session.execute(insert(Tag), new_tags[start : start + BATCH_SIZE])
+        session.commit()
+        author_ids = session.exec(select(Author.id)).all()
+        category_ids = session.exec(select(Category.id)).all()
+        ids_by_name = dict(
+            session.exec(select(Tag.name, Tag.id).where(Tag.name.like("tag-%"))).all()
+        )
+        tag_ids = [ids_by_name[tag_name(rank)] for rank in range(corpus.tags)]
+        cum_weights = list(
+            itertools.accumulate(
+                1 / (rank + 1) ** corpus.tag_skew for rank in range(corpus.tags)
+            )
+        )
+        existing = session.exec(select(func.count(Article.id))).one()
+        start_date = datetime(2015, 1, 1)
+        started = time.perf_counter()
+        for offset in range(existing, corpus.articles, BATCH_SIZE):
+            rows = []
+            for i in range(offset, min(offset + BATCH_SIZE, corpus.articles)):
+                content = " ".join(rng.choices(VOCABULARY, k=80))
+                rows.append(
+                    {
+                        "title": " ".join(rng.choices(VOCABULARY, k=5)).capitalize(),
+                        "content": content,
+                        "excerpt": make_excerpt(content),
+                        "published_at": start_date + timedelta(minutes=5 * i),
+                        "author_id": rng.choice(author_ids),
+                        "category_id": rng.choice(category_ids),
+                    }
+                )
+            ids = session.execute(insert(Article).returning(Article.id), rows)
+            links = [
+                {"article_id": article_id, "tag_id": tag_id}
+                for article_id in ids.scalars()
+                for tag_id in set(
+                    rng.choices(
+                        tag_ids, cum_weights=cum_weights, k=corpus.tags_per_article
+                    )
+                )
+            ]
+            session.execute(insert(ArticleTagLink), links)
+            session.commit()
+            done = min(offset + BATCH_SIZE, corpus.articles)
+            rate = (done - existing) / (time.perf_counter() - started)
+            print(f"seeded {done}/{corpus.articles} articles ({rate:.0f}/s)")
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+
+
+def add_arguments(parser: argparse.ArgumentParser, articles: int) -> None:
+    defaults = Corpus()
+    parser.add_argument("--articles", type=int, default=articles)
+    parser.add_argument("--tags", type=int, default=defaults.tags)
+    parser.add_argument("--authors", type=int, default=defaults.authors)
+    parser.add_argument("--categories", type=int, default=defaults.categories)
+    parser.add_argument("--tag-skew", type=float, default=defaults.tag_skew)
+
+
+def corpus_from_args(args: argparse.Namespace) -> Corpus:
+    return Corpus(
+        articles=args.articles,
+        tags=args.tags,
+        authors=args.authors,
+        categories=args.categories,
+        tag_skew=args.tag_skew,
+    )
+
+
+def use_scratch_database(name: str) -> None:
+    """Points REFLEX_DB_URL at a new SQLite file unless it is already set."""
+    if "REFLEX_DB_URL" not in os.environ:
+        path = os.path.join(tempfile.mkdtemp(), f"{name}.db")
+        os.environ["REFLEX_DB_URL"] = f"sqlite:///{path}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_arguments(parser, Corpus().articles)
+    args = parser.parse_args()
+    use_scratch_database("synthetic")
+    seed_corpus(corpus_from_args(args))
+    print(f"corpus ready at {os.environ['REFLEX_DB_URL']}")
+
+
+if __name__ == "__main__":
+    main()